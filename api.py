@@ -0,0 +1,154 @@
+"""
+Headless JSON API for Ressy.
+
+The router is mounted next to the Gradio UI (see ``create_server`` in
+``app.py``) and calls the same retrieval and completion functions, without
+Gradio's queue and event protocol in the way. Endpoints are plain ``def``
+functions so FastAPI runs the blocking LLM calls in its thread pool.
+"""
+import json
+from typing import List
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from limits import InputTooLarge, Overloaded
+from metrics import metrics
+from tenants import ProfileNotFound
+
+MAX_BATCH_SIZE = 32
+RETRY_AFTER_SECONDS = 5
+
+
+class AskRequest(BaseModel):
+    question: str = Field(..., min_length=1)
+
+
+class BatchAskRequest(BaseModel):
+    questions: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class JobMatchRequest(BaseModel):
+    job_description: str = Field(..., min_length=1)
+
+
+class ContactRequest(BaseModel):
+    message: str = Field(..., min_length=1)
+
+
+def _sse(payload):
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def create_api_router(
+    answer, answer_stream, answer_batch, match_job, contact, answer_profile=None, ground=None, contact_status=None
+):
+    """
+    Build the API router around the app's answer functions.
+    Args:
+        answer (callable): question -> (answer, excerpts).
+        answer_stream (callable): question -> iterator of answer text deltas. Input and
+            load limits should be checked when called; resources must only be held while
+            the iterator runs, since the response body may never be consumed.
+        answer_batch (callable): list of questions -> list of answers.
+        match_job (callable): job description -> (answer, excerpts).
+        contact (callable): message -> outbox id; raises ValueError for invalid messages and
+            RuntimeError when contact delivery is not configured.
+        answer_profile (callable): (profile_id, question) -> (answer, excerpts); raises
+            ProfileNotFound for unknown profiles. Enables ``/profiles/{profile_id}/ask``.
+        ground (callable): (answer, excerpts, known_links=None, extra_evidence="") -> grounding report
+            or None.
+            When given, single answers include it under "grounding".
+        contact_status (callable): outbox id -> status dict or None. Enables ``GET /contact/{id}``.
+    Returns:
+        router (APIRouter): Router to include under e.g. ``/api/v1``.
+    """
+    router = APIRouter()
+
+    def answer_body(text, excerpts, **ground_kwargs):
+        body = {"answer": text}
+        if ground is not None:
+            body["grounding"] = ground(text, excerpts, **ground_kwargs)
+        return body
+
+    def guarded(fn, *args):
+        # Limits surface as HTTP errors: 413 for oversized input, 503 + Retry-After when shedding load
+        try:
+            return fn(*args)
+        except InputTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except Overloaded as e:
+            raise HTTPException(
+                status_code=503, detail=str(e), headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+            )
+
+    @router.post("/ask")
+    def ask(request: AskRequest):
+        with metrics.timer("api_ask_seconds"):
+            text, excerpts = guarded(answer, request.question)
+        return answer_body(text, excerpts)
+
+    @router.post("/ask/stream")
+    def ask_stream(request: AskRequest):
+        deltas = guarded(answer_stream, request.question)
+
+        def events():
+            try:
+                for delta in deltas:
+                    yield _sse({"delta": delta})
+            except Exception as e:
+                yield _sse({"error": str(e)})
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(
+            events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+        )
+
+    @router.post("/ask/batch")
+    def ask_batch(request: BatchAskRequest):
+        with metrics.timer("api_ask_batch_seconds"):
+            answers = guarded(answer_batch, request.questions)
+        return {"answers": answers}
+
+    @router.post("/jd-match")
+    def jd_match(request: JobMatchRequest):
+        with metrics.timer("api_jd_match_seconds"):
+            text, excerpts = guarded(match_job, request.job_description)
+        # The answer restates the requirements, so the job description counts as evidence too
+        return answer_body(text, excerpts, extra_evidence=request.job_description)
+
+    @router.post("/contact", status_code=202)
+    def send_contact(request: ContactRequest):
+        try:
+            message_id = contact(request.message)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except RuntimeError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        return {"id": message_id, "status": "queued"}
+
+    if contact_status is not None:
+        @router.get("/contact/{message_id}")
+        def get_contact_status(message_id: int):
+            status = contact_status(message_id)
+            if status is None:
+                raise HTTPException(status_code=404, detail=f"Unknown contact message: {message_id}")
+            return status
+
+    if answer_profile is not None:
+        @router.post("/profiles/{profile_id}/ask")
+        def ask_profile(profile_id: str, request: AskRequest):
+            try:
+                with metrics.timer("api_profile_ask_seconds"):
+                    text, excerpts = guarded(answer_profile, profile_id, request.question)
+            except ProfileNotFound:
+                raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_id}")
+            # Hosted profiles may only cite links from their own excerpts
+            return answer_body(text, excerpts, known_links=())
+
+    @router.get("/metrics")
+    def get_metrics():
+        return metrics.snapshot()
+
+    return router
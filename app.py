@@ -1,63 +1,346 @@
 import gradio as gr
-from langchain.vectorstores import Chroma
 from gradio.components import Button
 from utils import (
-    load_text_data,
     resume_chat_completion,
+    resume_chat_completion_stream,
+    search_publications,
     semantic_search,
+    semantic_search_batch,
     setup_embedding_model,
-    get_publications
+    get_publications,
+    load_text_data,
+    JD_MATCH_PREFIX,
+    PUBLICATIONS_PATH,
 )
+from resume_index import FileWatcher, PublicationIndex, ResumeIndex
+from sessions import SessionStore
+from tenants import ProfileRegistry
+from llm_cache import ResponseCache
+from prefetch import RetrievalPrefetcher
+from entities import EntityIndex
+from grounding import GroundingChecker
+from outbox import ContactOutbox, TelegramSender
+from metrics import metrics
+from limits import AdmissionController, InputPolicy, InputTooLarge, Overloaded
+from static_assets import AssetStore, STATIC_DIR, create_asset_router, create_file_router, vendor_asset_urls
+from api import create_api_router
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI
+import uvicorn
+import atexit
+import json
+import logging
 import os
-import requests
+import signal
+import threading
+import time
 from groq import Groq
 from dotenv import load_dotenv
 
+load_dotenv()
+logging.basicConfig(level=os.getenv("RESSY_LOG_LEVEL", "INFO"))
+
 # Create cache directory
 os.makedirs('.gradio/cached_examples', exist_ok=True)
 
 # --- Load Models & Data ---
 embedding_model = setup_embedding_model(model_name="sentence-transformers/all-mpnet-base-v2")
-my_resume = load_text_data("data/resume.txt")
-chunks = [chunk.strip() for chunk in my_resume.split("---") if chunk.strip()]
-db = Chroma.from_texts(chunks, embedding_model)
-retriever = db.as_retriever(search_type="similarity", search_kwargs={"k": 5})
+resume_index = ResumeIndex(embedding_model, "data/resume.txt", k=5)
+publication_index = PublicationIndex(embedding_model, PUBLICATIONS_PATH, k=3)
+
+# --- Hosted profiles: other candidates, loaded on demand and sharing the embedding model ---
+profile_registry = ProfileRegistry(
+    os.getenv("RESSY_PROFILES_DIR", "profiles"),
+    embedding_model,
+    memory_budget=int(os.getenv("RESSY_PROFILE_MEMORY_MB", "256")) * 1024 * 1024,
+)
+
+# --- Hot reload: re-index when the resume changes, or on SIGHUP ---
+if os.getenv("RESSY_HOT_RELOAD", "1") != "0":
+    file_watcher = FileWatcher(interval=float(os.getenv("RESSY_RELOAD_INTERVAL", "2")))
+    file_watcher.watch(resume_index.path, resume_index.reload)
+    file_watcher.watch(publication_index.path, publication_index.reload)
+    file_watcher.start()
+
+def reload_indexes():
+    for index in (resume_index, publication_index):
+        index.reload(force=True)
+
+if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGHUP, lambda signum, frame: threading.Thread(
+        target=reload_indexes, daemon=True
+    ).start())
 
 # --- Setup LLM (Groq) ---
-load_dotenv()
 client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+# Answers persist across restarts; keys include the exact excerpts, so data changes never hit stale entries
+response_cache = None
+if os.getenv("RESSY_CACHE", "1") != "0":
+    response_cache = ResponseCache(
+        os.getenv("RESSY_CACHE_PATH", ".cache/responses.sqlite3"),
+        max_bytes=int(os.getenv("RESSY_CACHE_MAX_MB", "64")) * 1024 * 1024,
+        warm_entries=int(os.getenv("RESSY_CACHE_WARM_ENTRIES", "256")),
+    )
+    # Hit counts are batched in memory; write the last batch on a clean exit
+    atexit.register(response_cache.flush)
+
+# --- Chat sessions (history kept server-side) ---
+session_store = SessionStore(
+    max_sessions=int(os.getenv("RESSY_MAX_SESSIONS", "1000")),
+    ttl=float(os.getenv("RESSY_SESSION_TTL", "3600")),
+    db_path=os.getenv("RESSY_SESSION_DB"),
+)
 
-def send_telegram_message(message: str):
-    """Sends a suggestion message to Telegram and returns (status, clear_message)"""
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        return "ERROR: Telegram integration not configured on server.", message
+# --- Grounding check: answer sentences vs. retrieved excerpts, computed locally ---
+grounding_checker = None
+if os.getenv("RESSY_GROUNDING", "1") != "0":
+    grounding_checker = GroundingChecker(
+        embedding_model, threshold=float(os.getenv("RESSY_GROUNDING_THRESHOLD", "0.45"))
+    )
+publication_links = set()
+
+def refresh_publication_links(*_):
+    global publication_links
+    publication_links = {publication["link"] for publication in get_publications() if publication.get("link")}
+
+refresh_publication_links()
+publication_index.add_listener(refresh_publication_links)
+
+def check_grounding(bot_message, relevant_excerpts, known_links=None, extra_evidence=""):
+    """Grounding report for an answer (see grounding.py), or None when disabled
+    or when the answer came from the entity index (relevant_excerpts is None).
+    known_links defaults to Akshay's publication links; extra_evidence is other
+    prompt text the answer may restate, such as a job description."""
+    if grounding_checker is None or relevant_excerpts is None:
+        return None
+    if known_links is None:
+        known_links = publication_links
+    return grounding_checker.check(bot_message, relevant_excerpts, known_links, extra_evidence=extra_evidence)
+
+# --- Structured facts (skills, roles, certifications...) for instant list/lookup answers ---
+entity_index = None
+
+def rebuild_entity_index(*_):
+    global entity_index
+    with metrics.timer("entity_index_build_seconds"):
+        entity_index = EntityIndex(load_text_data(resume_index.path), get_publications())
+
+rebuild_entity_index()
+resume_index.add_listener(rebuild_entity_index)
+publication_index.add_listener(rebuild_entity_index)
+
+# Opt-in: restrict retrieval to the resume sections that mention the entities in a question
+SECTION_FILTER = os.getenv("RESSY_SECTION_FILTER", "0") == "1"
+ENTITY_ANSWERS = os.getenv("RESSY_ENTITY_ANSWERS", "1") != "0"
+
+def resume_sections_for(message):
+    """Section filter for retrieval, or None to search the whole resume."""
+    return (entity_index.sections_for(message) or None) if SECTION_FILTER else None
+
+def answer_from_index(message):
+    """Answer list/lookup questions from the entity index, or None if the LLM is needed."""
+    if not ENTITY_ANSWERS:
+        return None
+    start = time.perf_counter()
+    answer = entity_index.answer(message)
+    if answer is not None:
+        metrics.observe("entity_answer_seconds", time.perf_counter() - start)
+        metrics.incr("entity_answers")
+    return answer
+
+LLM_BATCH_CONCURRENCY = int(os.getenv("RESSY_LLM_BATCH_CONCURRENCY", "4"))
+
+# --- Input limits and backpressure ---
+# Long pastes are cut down before they reach the embedder or the prompt; bursts beyond
+# the waiting room are answered "busy" at once instead of piling up behind the LLM.
+input_policy = InputPolicy(
+    max_tokens=int(os.getenv("RESSY_MAX_INPUT_TOKENS", "600")),
+    hard_max_chars=int(os.getenv("RESSY_MAX_INPUT_CHARS", "20000")),
+    mode=os.getenv("RESSY_INPUT_POLICY", "extract"),
+)
+admission = AdmissionController(
+    max_concurrent=int(os.getenv("RESSY_MAX_CONCURRENT", "4")),
+    max_waiting=int(os.getenv("RESSY_MAX_WAITING", "16")),
+    wait_timeout=float(os.getenv("RESSY_QUEUE_TIMEOUT", "15")),
+)
+BUSY_REPLY = "I'm getting a lot of questions right now. Please try again in a few seconds."
+TOO_LONG_REPLY = (
+    "That message is too long for me to read in one go. "
+    "Could you paste just the key part, or ask a shorter question?"
+)
+
+RESEARCH_KEYWORDS = [
+    "publication", "publications", "published",
+    "research", "researches",
+    "paper", "papers",
+    "article", "articles",
+    "journal", "journals",
+    "author", "authored",
+    "contribution", "contributions",
+    "cite", "citations"
+]
+
+def retrieve_excerpts(message, resume_retriever, publication_retriever, sections=None):
+    """Resume excerpts for a message, plus matching publications for research questions.
+    sections optionally restricts the resume search to those section titles."""
+    relevant_excerpts = semantic_search(message, resume_retriever, sections)
+
+    # Check if the question is about publications/research
+    if publication_retriever is not None and any(keyword in message.lower() for keyword in RESEARCH_KEYWORDS):
+        publications_text = search_publications(message, publication_retriever)
+        relevant_excerpts += f"\n\nAdditional Publications:\n{publications_text}"
+    return relevant_excerpts
+
+def answer_question(message: str, relevant_excerpts=None):
+    """Retrieve resume excerpts for a message and generate Ressy's answer.
+    Pass relevant_excerpts to skip retrieval (e.g. when prefetched).
+    Returns (bot_message, relevant_excerpts); relevant_excerpts is None for
+    questions answered directly from the entity index.
+    Raises InputTooLarge or Overloaded when the input or server limits are hit."""
+    message = input_policy.apply(message)
+    direct = answer_from_index(message)
+    if direct is not None:
+        return direct, None
+    with admission:
+        return _answer_question(message, relevant_excerpts)
+
+def _answer_question(message, relevant_excerpts=None):
+    if relevant_excerpts is None:
+        relevant_excerpts = retrieve_excerpts(
+            message, resume_index.retriever, publication_index.retriever, resume_sections_for(message)
+        )
+
+    bot_message = resume_chat_completion(
+        client,
+        "llama-3.3-70b-versatile",
+        message,
+        relevant_excerpts,
+        cache=response_cache,
+    )
+    return bot_message, relevant_excerpts
+
+def gather_excerpts(messages):
+    """Retrieve excerpts for several messages with one batched embedding call."""
+    excerpts = semantic_search_batch(messages, resume_index.retriever)
+    for i, message in enumerate(messages):
+        if any(keyword in message.lower() for keyword in RESEARCH_KEYWORDS):
+            publications_text = search_publications(message, publication_index.retriever)
+            excerpts[i] += f"\n\nAdditional Publications:\n{publications_text}"
+    return excerpts
+
+def _admitted_completion(pair):
+    # One admission slot per completion, so RESSY_MAX_CONCURRENT bounds LLM calls across batches too
+    with admission:
+        return resume_chat_completion(client, "llama-3.3-70b-versatile", *pair, cache=response_cache)
+
+def answer_questions(messages):
+    """Answer a batch of messages: entity-index answers first, then batched retrieval
+    and concurrent completions for the rest. Retrieval takes one admission slot and
+    every completion takes its own."""
+    messages = [input_policy.apply(message) for message in messages]
+    answers = [answer_from_index(message) for message in messages]
+    pending = [message for message, answer in zip(messages, answers) if answer is None]
+    if pending:
+        with admission:
+            excerpts = gather_excerpts(pending)
+        with ThreadPoolExecutor(max_workers=min(len(pending), LLM_BATCH_CONCURRENCY)) as pool:
+            generated = iter(pool.map(_admitted_completion, zip(pending, excerpts)))
+            answers = [answer if answer is not None else next(generated) for answer in answers]
+    return answers
+
+def answer_question_stream(message: str):
+    """Like answer_question, but returns an iterator over the answer as it is generated.
+    Input limits and a full waiting room are reported before returning, so callers can
+    still turn them into errors; the work slot itself is only held while the iterator runs,
+    so a stream that is never consumed cannot leak it."""
+    message = input_policy.apply(message)
+    direct = answer_from_index(message)
+    if direct is not None:
+        return iter([direct])
+    admission.check()
+
+    def deltas():
+        with admission:
+            relevant_excerpts = gather_excerpts([message])[0]
+            yield from resume_chat_completion_stream(
+                client, "llama-3.3-70b-versatile", message, relevant_excerpts, cache=response_cache
+            )
+    return deltas()
+
+def answer_for_profile(profile_id: str, message: str):
+    """answer_question for a hosted profile. Raises ProfileNotFound for unknown ids."""
+    profile = profile_registry.get(profile_id)
+    message = input_policy.apply(message)
+    with admission:
+        return _answer_for_profile(profile, message)
+
+def _answer_for_profile(profile, message):
+    publication_retriever = profile.publication_index.retriever if profile.publication_index else None
+    relevant_excerpts = retrieve_excerpts(message, profile.resume_index.retriever, publication_retriever)
+    bot_message = resume_chat_completion(
+        client,
+        "llama-3.3-70b-versatile",
+        message,
+        relevant_excerpts,
+        system_prompt=profile.system_prompt,
+        first_name=profile.first_name,
+        cache=response_cache,
+    )
+    return bot_message, relevant_excerpts
+
+def match_job_description(job_description: str):
+    """Answer how Akshay's background matches a pasted job description."""
+    job_description = input_policy.apply(job_description)
+    with admission:
+        return _answer_question(JD_MATCH_PREFIX + job_description)
+
+# --- Speculative retrieval while typing (opt-in) ---
+prefetcher = None
+if os.getenv("RESSY_PREFETCH", "0") == "1":
+    prefetcher = RetrievalPrefetcher(
+        lambda text: retrieve_excerpts(
+            input_policy.apply(text), resume_index.retriever, publication_index.retriever, resume_sections_for(text)
+        ),
+        debounce=float(os.getenv("RESSY_PREFETCH_DEBOUNCE", "0.35")),
+    )
+    resume_index.add_listener(prefetcher.invalidate)
+    publication_index.add_listener(prefetcher.invalidate)
 
-    if not message.strip():
-        return "ERROR: Please enter a message before submitting", message
+TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
-    telegram_message_text = f"🌐 New Contact Message:\n\n{message}"
+# Contact messages go through a durable outbox; a background thread delivers them to Telegram
+contact_outbox = None
+if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+    contact_outbox = ContactOutbox(
+        os.getenv("RESSY_OUTBOX_PATH", ".cache/outbox.sqlite3"),
+        TelegramSender(
+            TELEGRAM_BOT_TOKEN,
+            TELEGRAM_CHAT_ID,
+            api_base=os.getenv("TELEGRAM_API_BASE", "https://api.telegram.org"),
+        ),
+        min_interval=float(os.getenv("RESSY_CONTACT_MIN_INTERVAL", "1.0")),
+    ).start()
+
+def queue_contact_message(message: str):
+    """Add a contact message to the outbox and return its id.
+    Raises RuntimeError if Telegram is not configured, ValueError for empty or oversized messages."""
+    if contact_outbox is None:
+        raise RuntimeError("Telegram integration not configured on server.")
+    return contact_outbox.enqueue(message)
+
+def contact_status(message_id: int):
+    """Delivery status of a queued contact message, or None if unknown."""
+    return contact_outbox.status(message_id) if contact_outbox is not None else None
 
+def send_telegram_message(message: str):
+    """Queues a suggestion message for Telegram and returns (status, clear_message)"""
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        payload = {
-            "chat_id": TELEGRAM_CHAT_ID,
-            "text": telegram_message_text
-        }
-
-        response = requests.post(url, json=payload)
-        if response.status_code == 200:
-            return "SUCCESS", ""  # Return success status and empty message to clear input
-        else:
-            error_msg = f"Failed to send: {response.status_code} - {response.text}"
-            print(f"Telegram API Error: {error_msg}")
-            return f"ERROR: {error_msg}", message  # Return error but keep user's message
-    except Exception as e:
-        error_msg = f"Network error: {str(e)}"
-        print(f"Error sending Telegram message: {error_msg}")
-        return f"ERROR: {error_msg}", message  # Return error but keep user's message
+        queue_contact_message(message)
+    except (RuntimeError, ValueError) as e:
+        return f"ERROR: {e}", message  # Return error but keep user's message
+    return "SUCCESS", ""  # Return success status and empty message to clear input
 
 # --- Custom CSS ---
 custom_css = """
@@ -538,16 +821,32 @@ button[aria-label="Scroll to bottom"] {
 }
 """
 
+# --- Page assets: self-hosted, versioned and loaded once from <head> ---
+asset_store = AssetStore(STATIC_DIR)
+# Third-party assets are self-hosted (scripts/fetch_assets.py); missing ones are left out, never hot-linked
+vendor_urls = vendor_asset_urls(asset_store)
+lottie_player_url = vendor_urls.get("vendor/dotlottie-player.mjs")
+intro_animation_url = vendor_urls.get("vendor/intro.lottie") if lottie_player_url else None
+# The resume PDF gets its own route, so downloads never take a Gradio queue slot
+resume_store = AssetStore("data")
+RESUME_PDF_ROUTE = "/resume.pdf"
+page_assets_config = json.dumps({
+    "lottiePlayer": lottie_player_url,
+    "successAnimation": vendor_urls.get("vendor/success.lottie"),
+})
+page_head = f"""
+<script>window.RESSY_ASSETS = {page_assets_config};</script>
+{f'<script type="module" src="{lottie_player_url}"></script>' if intro_animation_url else ""}
+<script src="{asset_store.url('ressy.js')}" defer></script>
+"""
+
 # --- Gradio UI ---
-with gr.Blocks(css=custom_css) as demo:
-    # MODIFIED: Define a gr.File component to serve the PDF for download
-    pdf_file_comp = gr.File(
-        value="data/resume.pdf",
-        visible=False,
-        file_count="single",
-        elem_id="pdf_file_component"
-    )
-    
+with gr.Blocks(
+    css=custom_css,
+    head=page_head,
+    # ressy.js initialises itself once the app has rendered; this only speeds that up if it has already loaded
+    js="() => { window.Ressy && window.Ressy.init(); }",
+) as demo:
     # Hidden Gradio Button to act as a bridge from HTML to Python for suggestion
     suggest_trigger_btn = gr.Button(visible=False, elem_id="suggest_trigger_btn_id")
 
@@ -607,9 +906,13 @@ with gr.Blocks(css=custom_css) as demo:
         fn=send_telegram_message,
         inputs=suggestion_box,
         outputs=[telegram_status_output_bridge, suggestion_box]  # Now outputs to both status bridge and suggestion box
+    ).then(
+        fn=None,
+        inputs=telegram_status_output_bridge,
+        js="(status) => { window.Ressy && window.Ressy.onContactStatus(status); }",
     )
 
-    gr.HTML("""
+    gr.HTML(f"""
 <style>
     /* Your CSS is defined in the custom_css python string above.
        This empty style tag is kept for consistency but is not strictly necessary here. */
@@ -628,7 +931,7 @@ with gr.Blocks(css=custom_css) as demo:
         </svg>
     </button>
 
-    <a id="download_icon" href="#" title="Download Resume" download="Akshay_Abraham_Resume.pdf">
+    <a id="download_icon" href="{RESUME_PDF_ROUTE}" title="Download Resume" download="Akshay_Abraham_Resume.pdf">
         <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">
             <path d="M5 20h14v-2H5v2zm7-18v10l4-4h-3V2h-2v6H8l4 4z"/>
         </svg>
@@ -661,144 +964,16 @@ with gr.Blocks(css=custom_css) as demo:
     <button id="close_info_modal">Close</button>
 </div>
 
-<div id="success_animation_modal">
-    <script src="https://unpkg.com/@dotlottie/player-component@2.7.12/dist/dotlottie-player.mjs" type="module"></script>
-    <dotlottie-player
-        src="https://lottie.host/805186b5-0c2d-450a-9d6c-6743b2f518e3/a87e5b1q7o.lottie"
-        background="transparent"
-        speed="1"
-        style="width: 100%; height: 100%"
-        loop
-        autoplay>
-    </dotlottie-player>
-    <p>Message sent successfully!</p>
-</div>
-
-
-<script>
-    document.addEventListener('DOMContentLoaded', (event) => {
-        // Info Modal Logic
-        const infoIcon = document.getElementById('info_icon');
-        const infoModal = document.getElementById('info_modal');
-        const closeInfoModal = document.getElementById('close_info_modal');
-
-        if (infoIcon && infoModal && closeInfoModal) {
-            infoIcon.onclick = () => {
-                infoModal.style.display = 'block';
-            };
-            closeInfoModal.onclick = () => {
-                infoModal.style.display = 'none';
-            };
-        }
-
-        // PDF Download Logic
-        // Use a MutationObserver to wait for the Gradio file component's link to be available
-        const pdfFileComponent = document.getElementById('pdf_file_component');
-        const customDownloadIcon = document.getElementById('download_icon');
-
-        if (pdfFileComponent && customDownloadIcon) {
-            const observer = new MutationObserver((mutations) => {
-                for (let mutation of mutations) {
-                    if (mutation.type === 'childList' || mutation.type === 'subtree') {
-                        const gradioDownloadLink = pdfFileComponent.querySelector('.file-preview a');
-                        if (gradioDownloadLink && gradioDownloadLink.href && customDownloadIcon.href === '#') {
-                            customDownloadIcon.href = gradioDownloadLink.href;
-                            observer.disconnect(); // Stop observing once the link is found
-                            break;
-                        }
-                    }
-                }
-            });
-
-            // Start observing the pdfFileComponent for changes to its children
-            observer.observe(pdfFileComponent, { childList: true, subtree: true });
-
-            // Fallback: If observer doesn't catch it immediately, try a timeout
-            setTimeout(() => {
-                const gradioDownloadLink = pdfFileComponent.querySelector('.file-preview a');
-                if (gradioDownloadLink && gradioDownloadLink.href && customDownloadIcon.href === '#') {
-                    customDownloadIcon.href = gradioDownloadLink.href;
-                }
-            }, 1000); // Give it a bit more time
-        }
-
-        // SUGGESTION (Connect with me) BUTTON BRIDGE:
-        const htmlSuggestIcon = document.getElementById('suggest_icon');
-        const gradioSuggestTrigger = document.getElementById('suggest_trigger_btn_id');
-
-        if (htmlSuggestIcon && gradioSuggestTrigger) {
-            htmlSuggestIcon.onclick = () => {
-                gradioSuggestTrigger.click(); // Programmatically click the hidden Gradio button
-                // Clear message display when opening
-                const modalMessageDisplay = document.getElementById('modal_message_display');
-                if(modalMessageDisplay) modalMessageDisplay.textContent = '';
-                const suggestionInput = document.querySelector('#suggestion_section_gradio textarea');
-                if(suggestionInput) suggestionInput.value = ''; // Clear input field
-            };
-        }
-
-        // Handle Telegram submission status and animation
-const telegramStatusOutputBridge = document.getElementById('telegram_status_output_bridge');
-const suggestionSectionGradio = document.getElementById('suggestion_section_gradio');
-const successAnimationModal = document.getElementById('success_animation_modal');
-const modalMessageDisplay = document.getElementById('modal_message_display');
-
-if (telegramStatusOutputBridge && suggestionSectionGradio && successAnimationModal && modalMessageDisplay) {
-    const observer = new MutationObserver((mutationsList) => {
-        for (const mutation of mutationsList) {
-            if (mutation.type === 'attributes' && mutation.attributeName === 'value') {
-                const status = telegramStatusOutputBridge.value;
-                if (status) {
-                    if (status === "SUCCESS") {
-                        // Hide Gradio modal
-                        const gradioModalRoot = document.getElementById('suggestion_section_gradio');
-                        if (gradioModalRoot) gradioModalRoot.style.display = 'none';
-
-                        // Show success animation with message
-                        successAnimationModal.innerHTML = `
-                            <dotlottie-player
-                                src="https://lottie.host/805186b5-0c2d-450a-9d6c-6743b2f518e3/a87e5b1q7o.lottie"
-                                background="transparent"
-                                speed="1"
-                                style="width: 150px; height: 150px; margin: 0 auto;"
-                                autoplay>
-                            </dotlottie-player>
-                            <p style="margin-top: 15px; font-size: 1.2em;">Message sent successfully! 🎉</p>
-                        `;
-                        successAnimationModal.style.display = 'block';
-
-                        setTimeout(() => {
-                            successAnimationModal.style.display = 'none';
-                        }, 3000);
-
-                    } else if (status.startsWith("ERROR:")) {
-                        modalMessageDisplay.style.color = '#ff6b6b';
-                        modalMessageDisplay.textContent = status.replace("ERROR:", "❌");
-                    }
-                    telegramStatusOutputBridge.value = '';
-                }
-            }
-        }
-    });
-
-    const targetNode = telegramStatusOutputBridge.querySelector('input, textarea');
-    if (targetNode) {
-        observer.observe(targetNode, { attributes: true, attributeFilter: ['value'] });
-    } else {
-        console.warn("Could not find input/textarea element inside telegram_status_output_bridge");
-    }
-}
-    }); // End DOMContentLoaded
-</script>
+<!-- Filled by static/ressy.js on a successful send, so the animation only loads when needed -->
+<div id="success_animation_modal"></div>
 """)
 
     # 🤖 Intro Section with Lottie + Example Prompts
     with gr.Column(visible=True, elem_id="intro_container") as intro_section:
-        gr.HTML("""
-        <script src="https://unpkg.com/@dotlottie/player-component@2.7.12/dist/dotlottie-player.mjs" type="module"></script>
+        gr.HTML(f"""
         <div id="lottie_container">
             <dotlottie-player
-                src="https://lottie.host/3a69db62-ac6b-419d-8949-79fe213690c8/QJbL66mr48.lottie"
+                src="{intro_animation_url}"
                 background="transparent"
                 speed="1"
                 style="width: 100%; height: 100%"
@@ -806,7 +981,7 @@ if (telegramStatusOutputBridge && suggestionSectionGradio && successAnimationMod
                 autoplay>
             </dotlottie-player>
         </div>
-        """)
+        """ if intro_animation_url else '<div id="lottie_container"></div>')
         gr.Markdown("""
         <div style='animation: fadeIn 0.8s ease-out; text-align: center;'>
         Hello! I'm your AI assistant <strong>Ressy 🤖</strong><br>
@@ -827,17 +1002,6 @@ if (telegramStatusOutputBridge && suggestionSectionGradio && successAnimationMod
             </div>
         </div>
 
-        <script>
-            function fillPromptAndSubmit(text) {
-                const textbox = document.querySelector("#input_textbox textarea");
-                textbox.value = text;
-                textbox.dispatchEvent(new Event('input', { bubbles: true }));
-                const submitButton = document.querySelector("#send_button");
-                if (submitButton) {
-                    submitButton.click();
-                }
-            }
-        </script>
         """)
 
     # 💬 Chatbot
@@ -851,92 +1015,92 @@ if (telegramStatusOutputBridge && suggestionSectionGradio && successAnimationMod
             container=False,
             elem_id="input_textbox",
             lines=1,
-            max_lines=5
+            max_lines=5,
+            max_length=input_policy.hard_max_chars,
         )
         submit = gr.Button("➤", elem_id="send_button")
 
     # 🧠 Response Logic
-    def user_submit(message, chat_history):
-        chat_history.append({"role": "user", "content": message})
-        return "", chat_history, gr.update(visible=False), gr.update(visible=True)
-
-    def bot_reply(chat_history):
-        message = chat_history[-1]["content"]
-        relevant_excerpts = semantic_search(message, retriever)
-        
-        # Check if the question is about publications/research
-        if any(keyword in message.lower() for keyword in [
-                    "publication", "publications", "published",
-                    "research", "researches", 
-                    "paper", "papers", 
-                    "article", "articles",
-                    "journal", "journals",
-                    "author", "authored",
-                    "contribution", "contributions",
-                    "cite", "citations"
-                ]):
-            publications = get_publications()
-            publications_text = "\n".join(
-                [f"- {pub['title']} ({pub['link']})" for pub in publications]
-            )
-            relevant_excerpts += f"\n\nAdditional Publications:\n{publications_text}"
-        
-        bot_message = resume_chat_completion(
-            client,
-            "llama-3.3-70b-versatile",
-            message,
-            relevant_excerpts
-        )
-        chat_history.append({"role": "assistant", "content": bot_message})
-        return chat_history
+    def user_submit(message, request: gr.Request):
+        session_store.append(request.session_hash, "user", message)
+        return "", session_store.history(request.session_hash), gr.update(visible=False), gr.update(visible=True)
+
+    def bot_reply(request: gr.Request):
+        session_id = request.session_hash
+        history = session_store.history(session_id)
+        # The session may have expired between the two events; there is nothing to answer then
+        if not history or history[-1]["role"] != "user":
+            return history
+        message = history[-1]["content"]
+        prefetched = prefetcher.take(session_id, message) if prefetcher else None
+        try:
+            bot_message, relevant_excerpts = answer_question(message, prefetched)
+            grounding = check_grounding(bot_message, relevant_excerpts)
+            if grounding and not grounding["grounded"]:
+                logging.warning("Unsupported sentences in answer: %s", grounding["unsupported"])
+        except InputTooLarge:
+            bot_message = TOO_LONG_REPLY
+        except Overloaded:
+            bot_message = BUSY_REPLY
+        session_store.append(session_id, "assistant", bot_message)
+        return session_store.history(session_id)
 
     # 📩 Bind Events
+    # Only the new message is sent; history lives in session_store
     submit.click(
-        user_submit, [msg, chatbot], [msg, chatbot, intro_section, chatbot], show_progress=False
+        user_submit, msg, [msg, chatbot, intro_section, chatbot], show_progress=False
     ).then(
-        bot_reply, chatbot, chatbot
+        bot_reply, None, chatbot
     )
 
     msg.submit(
-        user_submit, [msg, chatbot], [msg, chatbot, intro_section, chatbot], show_progress=False
+        user_submit, msg, [msg, chatbot, intro_section, chatbot], show_progress=False
     ).then(
-        bot_reply, chatbot, chatbot
+        bot_reply, None, chatbot
     )
 
-    # 🔄 Scroll + Hide Intro
-    gr.HTML("""
-<script>
-    const observer = new MutationObserver(() => {
-        const bot = document.querySelector("#chatbot");
-        if (bot) {
-            bot.scrollTo({ top: bot.scrollHeight, behavior: "smooth" });
-        }
-    });
-    observer.observe(document.querySelector("#chatbot"), {
-        childList: true,
-        subtree: true
-    });
-
-    const textbox = document.querySelector("#input_textbox textarea");
-    const button = document.querySelector("#send_button");
-
-    function clearAndHideIntro() {
-        textbox.value = "";
-        const intro = document.querySelector("#intro_container");
-        const chatbot = document.querySelector("#chatbot");
-        if (intro) intro.style.display = "none";
-        if (chatbot) chatbot.style.display = "block";
-    }
-
-    button.addEventListener("click", clearAndHideIntro);
-    textbox.addEventListener("keydown", function(e) {
-        if (e.key === "Enter" && !e.shiftKey) {
-            setTimeout(clearAndHideIntro, 10);
-        }
-    });
-</script>
-""")
+    if prefetcher is not None:
+        def prefetch_input(message, request: gr.Request):
+            prefetcher.update(request.session_hash, message)
+
+        msg.input(
+            prefetch_input, msg, None,
+            trigger_mode="always_last", show_progress="hidden", queue=False,
+        )
+
+# Bounded event queue: a full queue is refused by Gradio instead of growing without limit
+demo.queue(
+    default_concurrency_limit=admission.max_concurrent,
+    max_size=admission.max_concurrent + admission.max_waiting,
+)
+
+# 🌐 HTTP server: JSON API under /api/v1, Gradio UI at /
+def create_server():
+    server = FastAPI()
+    server.include_router(create_asset_router(asset_store))
+    server.include_router(
+        create_file_router(resume_store, RESUME_PDF_ROUTE, "resume.pdf", download_name="Akshay_Abraham_Resume.pdf")
+    )
+    server.include_router(
+        create_api_router(
+            answer=answer_question,
+            answer_stream=answer_question_stream,
+            answer_batch=answer_questions,
+            match_job=match_job_description,
+            answer_profile=answer_for_profile,
+            contact=queue_contact_message,
+            contact_status=contact_status,
+            ground=check_grounding,
+        ),
+        prefix="/api/v1",
+    )
+    return gr.mount_gradio_app(server, demo, path="/")
 
 # 🚀 Launch
 if __name__ == "__main__":
-    demo.launch()
\ No newline at end of file
+    uvicorn.run(
+        create_server(),
+        host=os.getenv("GRADIO_SERVER_NAME", "127.0.0.1"),
+        port=int(os.getenv("GRADIO_SERVER_PORT", "7860")),
+        timeout_keep_alive=int(os.getenv("RESSY_KEEP_ALIVE", "30")),
+    )
\ No newline at end of file
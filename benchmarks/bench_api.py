@@ -0,0 +1,113 @@
+"""
+Throughput comparison: Gradio event path vs. the direct JSON API.
+
+Starts the fake Groq server, serves ``app.create_server()`` (JSON API under
+``/api/v1`` and the Gradio UI at ``/``) with uvicorn on a local port, then
+replays the question set at each concurrency level through
+
+* the Gradio path: ``gradio_client`` calling ``/user_submit`` then ``/bot_reply``
+  (the same two events the UI fires), and
+* the API path: ``POST /api/v1/ask`` over keep-alive ``requests`` sessions.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_api --concurrency 1 4 16 --ttft 0.3
+"""
+import argparse
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.bench_bot_reply import import_app
+from benchmarks.common import load_question_set, summarise_latencies, write_json
+from benchmarks.fake_groq_server import FakeGroqConfig, start_fake_server
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(app):
+    """Run the combined API + Gradio server on a background thread."""
+    import uvicorn
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app.create_server(), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def run_level(workload, concurrency, make_client, call):
+    """Replay ``workload`` with one client per worker thread."""
+    local = threading.local()
+
+    def one(question):
+        if not hasattr(local, "client"):
+            local.client = make_client()
+        start = time.perf_counter()
+        call(local.client, question)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(one, workload))
+    wall = time.perf_counter() - start
+    summary = summarise_latencies(latencies)
+    summary["concurrency"] = concurrency
+    summary["throughput_rps"] = len(workload) / wall if wall else float("nan")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Gradio and direct API throughput.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeats", type=int, default=2)
+    parser.add_argument("--ttft", type=float, default=0.25)
+    parser.add_argument("--tokens-per-second", type=float, default=250.0)
+    parser.add_argument("--completion-tokens", type=int, default=120)
+    parser.add_argument("--output", help="Optional path to write the results as JSON.")
+    args = parser.parse_args()
+
+    from gradio_client import Client
+
+    fake, base_url = start_fake_server(FakeGroqConfig(args.ttft, args.tokens_per_second, args.completion_tokens))
+    app = import_app(base_url)
+    server, url = serve(app)
+    workload = load_question_set() * args.repeats
+
+    def gradio_call(client, question):
+        client.predict(question, api_name="/user_submit")
+        client.predict(api_name="/bot_reply")
+
+    def api_call(session, question):
+        response = session.post(f"{url}/api/v1/ask", json={"question": question}, timeout=120)
+        response.raise_for_status()
+
+    paths = {
+        "gradio": (lambda: Client(url, verbose=False), gradio_call),
+        "api": (requests.Session, api_call),
+    }
+    results = {"config": vars(args), "levels": []}
+    print(f"{'path':>7} {'conc':>5} {'p50 ms':>9} {'p90 ms':>9} {'req/s':>8}")
+    for level in args.concurrency:
+        for name, (make_client, call) in paths.items():
+            summary = run_level(workload, level, make_client, call)
+            summary["path"] = name
+            results["levels"].append(summary)
+            print(f"{name:>7} {level:>5} {summary['p50_ms']:>9.1f} {summary['p90_ms']:>9.1f} {summary['throughput_rps']:>8.2f}")
+
+    server.should_exit = True
+    fake.shutdown()
+    if args.output:
+        write_json(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
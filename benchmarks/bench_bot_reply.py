@@ -0,0 +1,124 @@
+"""
+Offline latency/throughput benchmark for ``bot_reply``.
+
+Questions are replayed through ``app.answer_question``, the retrieval +
+completion path behind ``bot_reply`` (minus the Gradio session plumbing).
+
+A fake Groq server (see ``benchmarks/fake_groq_server.py``) is started on a
+local port and the Groq client in ``app.py`` is pointed at it through
+``GROQ_BASE_URL``, so the only real work measured is the local retrieval plus
+the simulated LLM latency. Run from the repository root::
+
+    python -m benchmarks.bench_bot_reply --concurrency 1 2 4 8 16 --ttft 0.3
+
+The embedding model must already be in the local Hugging Face cache.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import load_question_set, summarise_latencies, write_json
+from benchmarks.fake_groq_server import FakeGroqConfig, start_fake_server
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_app(base_url, response_cache=False):
+    """
+    Import ``app`` with the Groq client redirected to ``base_url``.
+    The persistent response cache is off unless asked for, so repeats measure real work.
+    """
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ.setdefault("GROQ_API_KEY", "fake-key")
+    os.environ["RESSY_CACHE"] = "1" if response_cache else "0"
+    os.chdir(REPO_ROOT)
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import app
+    return app
+
+
+def bench_retrieval(app, questions, repeats):
+    """Time ``semantic_search`` alone, one query at a time."""
+    latencies = []
+    for _ in range(repeats):
+        for question in questions:
+            start = time.perf_counter()
+            app.semantic_search(question, app.resume_index.retriever)
+            latencies.append(time.perf_counter() - start)
+    return summarise_latencies(latencies)
+
+
+def ask(app, question):
+    start = time.perf_counter()
+    bot_message, relevant_excerpts = app.answer_question(question)
+    app.check_grounding(bot_message, relevant_excerpts)
+    return time.perf_counter() - start
+
+
+def bench_end_to_end(app, questions, concurrency, repeats):
+    """Replay the question set through ``answer_question`` and the grounding check with ``concurrency`` workers."""
+    workload = questions * repeats
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda q: ask(app, q), workload))
+    wall = time.perf_counter() - start
+    summary = summarise_latencies(latencies)
+    summary["concurrency"] = concurrency
+    summary["wall_s"] = wall
+    summary["throughput_rps"] = len(workload) / wall if wall else float("nan")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bot_reply against a fake Groq server.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeats", type=int, default=3, help="Times to replay the question set per level.")
+    parser.add_argument("--ttft", type=float, default=0.25, help="Simulated time to first token (s).")
+    parser.add_argument("--tokens-per-second", type=float, default=250.0)
+    parser.add_argument("--completion-tokens", type=int, default=120)
+    parser.add_argument("--response-cache", action="store_true", help="Enable the persistent LLM answer cache.")
+    parser.add_argument("--output", help="Optional path to write the results as JSON.")
+    args = parser.parse_args()
+
+    config = FakeGroqConfig(args.ttft, args.tokens_per_second, args.completion_tokens)
+    server, base_url = start_fake_server(config)
+    app = import_app(base_url, response_cache=args.response_cache)
+    questions = load_question_set()
+
+    # Warm up the embedding model and HTTP connection pool
+    ask(app, questions[0])
+
+    results = {
+        "config": vars(args),
+        "retrieval": bench_retrieval(app, questions, args.repeats),
+        "end_to_end": [],
+    }
+    print(
+        "retrieval: p50 {p50_ms:.1f} ms  p90 {p90_ms:.1f} ms  p99 {p99_ms:.1f} ms".format(**results["retrieval"])
+    )
+    print(f"{'conc':>5} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+    for level in args.concurrency:
+        summary = bench_end_to_end(app, questions, level, args.repeats)
+        results["end_to_end"].append(summary)
+        print(
+            f"{level:>5} {summary['p50_ms']:>9.1f} {summary['p90_ms']:>9.1f} "
+            f"{summary['p99_ms']:>9.1f} {summary['throughput_rps']:>8.2f}"
+        )
+
+    from metrics import metrics
+
+    grounding = metrics.snapshot()["timings"].get("grounding_seconds")
+    if grounding:
+        results["grounding"] = grounding
+        print("grounding check: p50 {p50_ms:.1f} ms  p95 {p95_ms:.1f} ms per answer".format(**grounding))
+
+    server.shutdown()
+    if args.output:
+        write_json(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
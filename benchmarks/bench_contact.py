@@ -0,0 +1,97 @@
+"""
+Contact outbox benchmark against a local fake Telegram server.
+
+Enqueues a burst of contact messages, then waits for the background sender
+to deliver them through ``benchmarks/fake_telegram_server.py`` (with
+optional injected failures and rate limiting). Reports enqueue latency,
+time until every message was delivered, the number of Bot API calls made,
+and checks that every message arrived exactly once::
+
+    python -m benchmarks.bench_contact --messages 50 --failure-rate 0.2
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.common import summarise_latencies, write_json  # noqa: E402
+from benchmarks.fake_telegram_server import FakeTelegramConfig, start_fake_server  # noqa: E402
+from outbox import ContactOutbox, TelegramSender  # noqa: E402
+
+
+def run(args):
+    config = FakeTelegramConfig(
+        latency=args.latency, failure_rate=args.failure_rate, min_interval=args.server_interval, seed=args.seed
+    )
+    server, base_url = start_fake_server(config)
+    with tempfile.TemporaryDirectory() as root:
+        outbox = ContactOutbox(
+            os.path.join(root, "outbox.sqlite3"),
+            TelegramSender("fake-token", "1", api_base=base_url),
+            min_interval=args.min_interval,
+            base_backoff=0.5,
+        ).start()
+
+        texts = [f"Message {i}: hello from benchmark visitor {i}." for i in range(args.messages)]
+        enqueue_latencies, ids = [], []
+        start = time.perf_counter()
+        for text in texts:
+            t0 = time.perf_counter()
+            ids.append(outbox.enqueue(text))
+            enqueue_latencies.append(time.perf_counter() - t0)
+
+        deadline = time.monotonic() + args.timeout
+        while outbox.pending() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        drained = time.perf_counter() - start
+        outbox.stop()
+        statuses = [outbox.status(message_id)["status"] for message_id in ids]
+    server.shutdown()
+
+    received = "\n".join(config.messages)
+    return {
+        "config": vars(args),
+        "enqueue": summarise_latencies(enqueue_latencies),
+        "drain_s": drained,
+        "delivered": statuses.count("delivered"),
+        "failed": statuses.count("failed"),
+        "api_calls": config.requests_served,
+        "telegram_messages": len(config.messages),
+        "rate_limited": config.rate_limited,
+        "injected_failures": config.failed,
+        "missing": sum(1 for text in texts if received.count(text) == 0),
+        "duplicated": sum(1 for text in texts if received.count(text) > 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the contact outbox against a fake Telegram server.")
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake API latency in seconds.")
+    parser.add_argument("--min-interval", type=float, default=1.0, help="Outbox spacing between sends.")
+    parser.add_argument("--server-interval", type=float, default=1.0, help="Fake API rate limit.")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    results = run(args)
+    print("enqueue: p50 {p50_ms:.2f} ms  p99 {p99_ms:.2f} ms".format(**results["enqueue"]))
+    print(
+        f"drained {results['delivered']}/{args.messages} in {results['drain_s']:.1f} s with "
+        f"{results['api_calls']} API calls ({results['telegram_messages']} Telegram messages, "
+        f"{results['rate_limited']} rate limited, {results['injected_failures']} injected failures)"
+    )
+    print(f"missing {results['missing']}, duplicated {results['duplicated']}, failed {results['failed']}")
+    if args.output:
+        write_json(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
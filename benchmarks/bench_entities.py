@@ -0,0 +1,103 @@
+"""
+Entity index benchmark.
+
+Builds the ``EntityIndex`` from ``data/resume.txt`` and the publications
+file, then runs the question set through it. Reports build time, which
+questions are answered directly (no retrieval or LLM call) and the latency
+of those answers. Also checks that questions the tables cannot answer
+(negations, plans, recency, things not on the resume) fall through to
+retrieval, and that qualified skill questions ("web frameworks") list only
+the matching group::
+
+    python -m benchmarks.bench_entities --repeats 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.common import load_question_set, summarise_latencies, write_json  # noqa: E402
+from entities import EntityIndex  # noqa: E402
+from utils import PUBLICATIONS_PATH, load_publications, load_text_data  # noqa: E402
+
+# Questions that must not be answered from the index: they need retrieval and the LLM
+MUST_FALL_THROUGH = [
+    "Has Akshay published any books?",
+    "What papers has Akshay read?",
+    "What skills does Akshay lack?",
+    "What skills does Akshay not have?",
+    "What positions is Akshay looking for?",
+    "What roles is Akshay interested in?",
+    "Has Akshay worked at Google?",
+    "Did Akshay study at Oxford?",
+    "Does Akshay know Rust?",
+    "Does Akshay speak French?",
+    "What DevOps tools has Akshay used?",
+    "Which Azure tools has Akshay used?",
+    "What is Akshay's current job?",
+    "What was Akshay's most recent role?",
+]
+# Questions whose qualifier narrows the skills to one resume heading
+NARROWED = [
+    ("What web frameworks has Akshay used?", "Web app development"),
+    ("Which cloud tools does Akshay know?", "Cloud computing"),
+    ("Which database tools has Akshay used?", "Database management"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark direct answers from the entity index.")
+    parser.add_argument("--repeats", type=int, default=1000)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = EntityIndex(
+        load_text_data(os.path.join(REPO_ROOT, "data", "resume.txt")),
+        load_publications(os.path.join(REPO_ROOT, PUBLICATIONS_PATH)),
+    )
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"built index in {build_ms:.1f} ms ({len(index.terms)} terms)")
+
+    questions = load_question_set()
+    direct = [question for question in questions if index.answer(question) is not None]
+    latencies = []
+    for _ in range(args.repeats):
+        for question in questions:
+            start = time.perf_counter()
+            index.answer(question)
+            latencies.append(time.perf_counter() - start)
+    summary = summarise_latencies(latencies)
+
+    for question in questions:
+        print(f"{'direct' if question in direct else 'llm   '}  {question[:70]}")
+    print(
+        f"{len(direct)}/{len(questions)} answered directly; "
+        "lookup p50 {p50_ms:.3f} ms  p99 {p99_ms:.3f} ms".format(**summary)
+    )
+    wrongly_answered = [question for question in MUST_FALL_THROUGH if index.answer(question) is not None]
+    for question in wrongly_answered:
+        print(f"FAIL  answered from the index, expected retrieval: {question}")
+    print(f"{len(MUST_FALL_THROUGH) - len(wrongly_answered)}/{len(MUST_FALL_THROUGH)} fall-through checks passed")
+    wrongly_narrowed = []
+    for question, heading in NARROWED:
+        groups = [line for line in (index.answer(question) or "").splitlines() if line.startswith("- **")]
+        if len(groups) != 1 or not groups[0].startswith(f"- **{heading}:**"):
+            wrongly_narrowed.append(question)
+            print(f"FAIL  expected only the {heading} group: {question}")
+    print(f"{len(NARROWED) - len(wrongly_narrowed)}/{len(NARROWED)} narrowed-answer checks passed")
+    if args.output:
+        write_json(args.output, {
+            "build_ms": build_ms, "direct": direct, "latency": summary, "wrongly_answered": wrongly_answered,
+            "wrongly_narrowed": wrongly_narrowed,
+        })
+    if wrongly_answered or wrongly_narrowed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Page weight and time-to-interactive measurement in a headless browser.
+
+Serves the app (against the fake Groq server) and loads it in headless
+Chromium via Playwright, optionally throttled to a mobile connection. For a
+cold load and a warm reload it reports the number of requests (and how many
+went to third-party hosts), bytes transferred, DOMContentLoaded, load, and
+time to interactive, taken as the ``ressy-interactive`` performance mark set
+when ``static/ressy.js`` has wired up the page. Requires the optional
+``playwright`` package and ``playwright install chromium``::
+
+    python -m benchmarks.bench_page --network fast3g
+"""
+import argparse
+from urllib.parse import urlparse
+
+from benchmarks.bench_api import serve
+from benchmarks.bench_bot_reply import import_app
+from benchmarks.common import write_json
+from benchmarks.fake_groq_server import start_fake_server
+
+# Chrome DevTools presets (throughput in bytes/s, latency in ms)
+NETWORKS = {
+    "none": None,
+    "fast3g": {"latency": 150, "downloadThroughput": 1.6 * 1024 * 1024 / 8, "uploadThroughput": 750 * 1024 / 8},
+    "slow3g": {"latency": 400, "downloadThroughput": 500 * 1024 / 8, "uploadThroughput": 500 * 1024 / 8},
+}
+
+TIMINGS_JS = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const resources = performance.getEntriesByType("resource");
+    const mark = performance.getEntriesByName("ressy-interactive")[0];
+    return {
+        transfer_bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+        load_ms: nav ? nav.loadEventEnd : null,
+        interactive_ms: mark ? mark.startTime : null,
+    };
+}
+"""
+
+
+def measure(page, url, origin_host, reload=False):
+    requests = []
+
+    def record(request):
+        requests.append(request.url)
+
+    page.on("request", record)
+    if reload:
+        page.reload(wait_until="load")
+    else:
+        page.goto(url, wait_until="load")
+    page.wait_for_function("() => performance.getEntriesByName('ressy-interactive').length > 0", timeout=60000)
+    page.wait_for_load_state("networkidle")
+    result = page.evaluate(TIMINGS_JS)
+    result["requests"] = len(requests)
+    result["third_party_requests"] = sum(1 for r in requests if urlparse(r).hostname not in (origin_host, None))
+    page.remove_listener("request", record)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure page weight and time to interactive.")
+    parser.add_argument("--network", choices=sorted(NETWORKS), default="fast3g")
+    parser.add_argument("--output", help="Optional path to write the results as JSON.")
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    fake, base_url = start_fake_server()
+    app = import_app(base_url)
+    server, url = serve(app)
+    origin_host = urlparse(url).hostname
+
+    results = {"network": args.network}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_context().new_page()
+        conditions = NETWORKS[args.network]
+        if conditions:
+            cdp = page.context.new_cdp_session(page)
+            cdp.send("Network.enable")
+            cdp.send("Network.emulateNetworkConditions", {"offline": False, **conditions})
+        results["cold"] = measure(page, url, origin_host)
+        results["warm"] = measure(page, url, origin_host, reload=True)
+        browser.close()
+
+    for name in ("cold", "warm"):
+        r = results[name]
+        print(
+            f"{name:>4}: {r['requests']} requests ({r['third_party_requests']} third-party), "
+            f"{r['transfer_bytes'] / 1024:.0f} KiB, DCL {r['dom_content_loaded_ms']:.0f} ms, "
+            f"load {r['load_ms']:.0f} ms, interactive {r['interactive_ms']:.0f} ms"
+        )
+    server.should_exit = True
+    fake.shutdown()
+    if args.output:
+        write_json(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Check that publication retrieval returns the right entries as the list grows.
+
+Builds a ``PublicationIndex`` over the real ``data/publications.json`` padded
+with synthetic entries up to each requested size and runs questions through
+``search_publications``. Specific questions must return the expected entry
+with its link; "list all" questions must list the first entries in file
+order plus a count of the rest; questions that merely contain "every" must
+not list everything. The retrieved block must also stay within a fixed
+token bound as the list grows, unlike appending the whole list. Exits
+non-zero if any check fails::
+
+    python -m benchmarks.bench_publications --sizes 10 100 500
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from resume_index import PublicationIndex  # noqa: E402
+from utils import (  # noqa: E402
+    LIST_ALL_LIMIT,
+    estimate_tokens,
+    load_publications,
+    search_publications,
+    setup_embedding_model,
+)
+
+# (question, start of the title of the entry it must return)
+EXPECTED_ENTRIES = [
+    ("Has Akshay published any research papers?", "Design and validation of novel SARS-CoV-2 inhibitors"),
+    ("Tell me about Akshay's research on SARS-CoV-2.", "Design and validation of novel SARS-CoV-2 inhibitors"),
+    ("What apps has Akshay published?", "Periodic Table Mobile App"),
+    ("Did Akshay build a Chrome extension for tracking job applications?", "Job Application Manager"),
+]
+LIST_ALL_QUESTIONS = [
+    "List all of Akshay's publications.",
+    "Give me the complete list of Akshay's publications with links.",
+]
+# Contain "all"/"every" without asking for the whole list
+NOT_LIST_ALL_QUESTIONS = [
+    "Has Akshay published research in every field?",
+    "Has Akshay published any research papers at all?",
+]
+TOPICS = ["protein folding", "catalysis", "QSAR modelling", "lab automation", "spectroscopy", "web APIs"]
+
+
+def publication_line(publication):
+    """The line ``search_publications`` emits for an entry."""
+    link = publication.get("link")
+    return f"- {publication['title']} ({link})" if link else f"- {publication['title']}"
+
+
+def synthetic_publications(base, size):
+    """Pad the real entries with numbered synthetic ones up to ``size``."""
+    publications = list(base)
+    for i in range(len(publications), size):
+        topic = TOPICS[i % len(TOPICS)]
+        publications.append(
+            {
+                "type": "publication",
+                "title": f"Synthetic study {i} on {topic} with machine learning",
+                "link": f"https://doi.org/10.0000/synthetic.{i}",
+                "summary": f"Placeholder entry {i} used to grow the publication list.",
+            }
+        )
+    return publications
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publication retrieval checks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--model", default="sentence-transformers/all-mpnet-base-v2")
+    args = parser.parse_args()
+
+    embedding_model = setup_embedding_model(model_name=args.model)
+    base = load_publications(os.path.join(REPO_ROOT, "data", "publications.json"))
+    failures = []
+
+    print(f"{'entries':>8} {'full list tok':>14} {'retrieved tok':>14} {'bound':>7} {'checks':>7}")
+    for size in args.sizes:
+        publications = synthetic_publications(base, size)
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+            json.dump(publications, file)
+        try:
+            index = PublicationIndex(embedding_model, file.name, k=args.k, name=f"bench-publications-{size}")
+        finally:
+            os.unlink(file.name)
+
+        checks = 0
+        retrieved_tokens = 0
+        for question, title in EXPECTED_ENTRIES:
+            expected = next(p for p in base if p["title"].startswith(title))
+            text = search_publications(question, index.retriever)
+            retrieved_tokens = max(retrieved_tokens, estimate_tokens(text))
+            checks += 1
+            if publication_line(expected) not in text.splitlines():
+                failures.append(f"{size} entries: {question!r} did not return {publication_line(expected)!r}")
+        for question in LIST_ALL_QUESTIONS:
+            text = search_publications(question, index.retriever)
+            retrieved_tokens = max(retrieved_tokens, estimate_tokens(text))
+            lines = text.splitlines()
+            expected = [publication_line(p) for p in publications[:LIST_ALL_LIMIT]]
+            checks += 1
+            if lines[:len(expected)] != expected:
+                failures.append(f"{size} entries: {question!r} did not list the first {len(expected)} entries in order")
+            remaining = len(publications) - len(expected)
+            checks += 1
+            if (remaining and lines[len(expected):] != [f"- ...and {remaining} more entries not listed here"]) or (
+                not remaining and len(lines) != len(expected)
+            ):
+                failures.append(f"{size} entries: {question!r} did not end with a count of the {remaining} unlisted")
+        for question in NOT_LIST_ALL_QUESTIONS:
+            text = search_publications(question, index.retriever)
+            retrieved_tokens = max(retrieved_tokens, estimate_tokens(text))
+            checks += 1
+            if len(text.splitlines()) > args.k:
+                failures.append(f"{size} entries: {question!r} listed {len(text.splitlines())} entries, k is {args.k}")
+        index.close()
+
+        # Bound from the data and limits alone: the most entries any question may list, at the longest entry size
+        longest_entry = max(estimate_tokens(publication_line(p)) for p in publications)
+        count_line = estimate_tokens(f"- ...and {len(publications)} more entries not listed here")
+        bound = max(args.k, LIST_ALL_LIMIT) * (longest_entry + 1) + count_line
+        checks += 1
+        if retrieved_tokens > bound:
+            failures.append(f"{size} entries: retrieved block of {retrieved_tokens} tokens exceeds the bound of {bound}")
+
+        full_tokens = estimate_tokens("\n".join(publication_line(p) for p in publications))
+        print(f"{size:>8} {full_tokens:>14} {retrieved_tokens:>14} {bound:>7} {checks:>7}")
+
+    for failure in failures:
+        print(f"FAIL  {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: expected entries and links are returned and the retrieved block stays bounded as the list grows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Memory and latency benchmark for multi-tenant profile serving.
+
+Generates N synthetic profiles (copies of ``data/resume.txt`` with the name
+and a per-profile detail changed, so every profile's chunks are distinct),
+then sends retrieval queries to random profiles through a ``ProfileRegistry``
+sharing one embedding model. Access follows a Zipf-like distribution so some
+profiles are hot and others cold. Reports cold-load and warm query latency,
+hit rate, evictions, the registry's memory estimate and process RSS::
+
+    python -m benchmarks.bench_tenants --profiles 100 1000 --budget-mb 64
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.common import load_question_set, summarise_latencies, write_json  # noqa: E402
+from metrics import metrics  # noqa: E402
+from tenants import ProfileRegistry  # noqa: E402
+from utils import load_text_data, semantic_search, setup_embedding_model  # noqa: E402
+
+CITIES = ["Leeds", "Belfast", "Chennai", "Bristol", "Kochi", "Glasgow", "Cardiff", "Pune"]
+
+
+def make_profiles(root, count):
+    """Write ``count`` synthetic profile directories under ``root``."""
+    base = load_text_data(os.path.join(REPO_ROOT, "data", "resume.txt"))
+    for i in range(count):
+        directory = os.path.join(root, f"candidate-{i:04d}")
+        os.makedirs(directory, exist_ok=True)
+        text = base.replace("Akshay Abraham", f"Candidate {i}").replace("Akshay", f"Candidate {i}")
+        text = text.replace("Portadown", CITIES[i % len(CITIES)]).replace("2023-2024", f"{2000 + i % 25}-{2001 + i % 25}")
+        with open(os.path.join(directory, "resume.txt"), "w", encoding="utf-8") as file:
+            file.write(f"Candidate number {i}\n\n" + text)
+
+
+def rss_mb():
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run(embedding_model, count, requests, budget_mb, seed):
+    questions = load_question_set()
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(count)]
+    with tempfile.TemporaryDirectory() as root:
+        make_profiles(root, count)
+        registry = ProfileRegistry(root, embedding_model, memory_budget=budget_mb * 1024 * 1024)
+        profile_ids = registry.profile_ids()
+        cold, warm = [], []
+        hits_before = metrics.counter("profile_cache_hits")
+        misses_before = metrics.counter("profile_cache_misses")
+        evictions_before = metrics.counter("profile_evictions")
+        rss_before = rss_mb()
+
+        for _ in range(requests):
+            profile_id = rng.choices(profile_ids, weights)[0]
+            question = rng.choice(questions)
+            was_loaded = profile_id in registry.loaded_ids()
+            start = time.perf_counter()
+            profile = registry.get(profile_id)
+            semantic_search(question, profile.resume_index.retriever)
+            (warm if was_loaded else cold).append(time.perf_counter() - start)
+
+        hits = metrics.counter("profile_cache_hits") - hits_before
+        misses = metrics.counter("profile_cache_misses") - misses_before
+        result = {
+            "profiles": count,
+            "requests": requests,
+            "budget_mb": budget_mb,
+            "loaded_at_end": len(registry.loaded_ids()),
+            "hit_rate": hits / (hits + misses) if hits + misses else float("nan"),
+            "evictions": metrics.counter("profile_evictions") - evictions_before,
+            "registry_estimate_mb": registry.memory_bytes() / (1024 * 1024),
+            "peak_rss_mb": rss_mb(),
+            "peak_rss_growth_mb": rss_mb() - rss_before,
+            "cold": summarise_latencies(cold),
+            "warm": summarise_latencies(warm),
+        }
+        registry.close()
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-tenant profile serving benchmark.")
+    parser.add_argument("--profiles", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--budget-mb", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--model", default="sentence-transformers/all-mpnet-base-v2")
+    parser.add_argument("--output", help="Optional path to write the results as JSON.")
+    args = parser.parse_args()
+
+    embedding_model = setup_embedding_model(model_name=args.model)
+    results = []
+    for count in args.profiles:
+        result = run(embedding_model, count, args.requests, args.budget_mb, args.seed)
+        results.append(result)
+        print(
+            f"{count:>5} profiles: hit rate {result['hit_rate']:.2f}, {result['loaded_at_end']} loaded, "
+            f"{result['evictions']} evictions, estimate {result['registry_estimate_mb']:.1f} MiB, "
+            f"peak RSS {result['peak_rss_mb']:.0f} MiB"
+        )
+        print(
+            f"       cold p50 {result['cold']['p50_ms']:.0f} ms p99 {result['cold']['p99_ms']:.0f} ms | "
+            f"warm p50 {result['warm']['p50_ms']:.1f} ms p99 {result['warm']['p99_ms']:.1f} ms"
+        )
+    if args.output:
+        write_json(args.output, {"config": vars(args), "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Small helpers shared by the benchmark scripts."""
+import json
+import math
+import os
+
+QUESTIONS_PATH = os.path.join(os.path.dirname(__file__), "questions.json")
+
+
+def load_question_set(path=QUESTIONS_PATH):
+    """
+    Load the fixed benchmark question set.
+    Args:
+        path (str): Path to the questions JSON file.
+    Returns:
+        questions (list): Intro prompts, free-form questions and job descriptions, in that order.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return data["intro_prompts"] + data["questions"] + data["job_descriptions"]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (``pct`` in 0-100)."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarise_latencies(latencies):
+    """Return count/mean/p50/p90/p99/max (milliseconds) for a list of seconds."""
+    ms = [value * 1000.0 for value in latencies]
+    return {
+        "count": len(ms),
+        "mean_ms": sum(ms) / len(ms) if ms else float("nan"),
+        "p50_ms": percentile(ms, 50),
+        "p90_ms": percentile(ms, 90),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": max(ms) if ms else float("nan"),
+    }
+
+
+def write_json(path, payload):
+    """Write ``payload`` as pretty JSON, creating parent directories."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=2)
@@ -0,0 +1,212 @@
+"""
+Local stand-in for the Groq (OpenAI-compatible) chat completions API.
+
+The server answers ``POST /openai/v1/chat/completions`` (the path used by the
+``groq`` SDK) and ``POST /v1/chat/completions`` (plain OpenAI clients) with a
+canned answer, after sleeping to mimic a configurable time-to-first-token and
+token rate. Both regular and ``stream=True`` (server-sent events) requests are
+supported, so benchmarks can exercise ``app.py`` end to end without a network.
+
+Point the app at it with::
+
+    GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=fake python app.py
+
+or run it standalone::
+
+    python -m benchmarks.fake_groq_server --port 8765 --ttft 0.3 --tokens-per-second 250
+"""
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETION_PATHS = ("/openai/v1/chat/completions", "/v1/chat/completions")
+
+FILLER_WORDS = (
+    "Akshay has hands-on experience with Python, SQL and Django, and has built "
+    "machine learning and cheminformatics pipelines such as Ligand Explorer."
+).split()
+
+
+class FakeGroqConfig:
+    """
+    Latency profile of the fake server.
+    Args:
+        ttft (float): Seconds to wait before the first token is produced.
+        tokens_per_second (float): Generation speed after the first token.
+        completion_tokens (int): Number of tokens (words) in every answer.
+    """
+
+    def __init__(self, ttft=0.25, tokens_per_second=250.0, completion_tokens=120):
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        self.requests_served = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests_served += 1
+
+    def answer_tokens(self):
+        return [FILLER_WORDS[i % len(FILLER_WORDS)] for i in range(self.completion_tokens)]
+
+    def token_delay(self):
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return 1.0 / self.tokens_per_second
+
+
+def _completion_body(model, content, prompt_tokens, completion_tokens):
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _chunk_body(chunk_id, model, delta, finish_reason=None):
+    return {
+        "id": chunk_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def make_handler(config):
+    """Build a request handler class bound to ``config``."""
+
+    class FakeGroqHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            # Keep benchmark output readable
+            pass
+
+        def _send_json(self, status, body):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                self._send_json(200, {"object": "list", "data": []})
+            else:
+                self._send_json(404, {"error": {"message": "not found"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b"{}"
+            if self.path not in COMPLETION_PATHS:
+                self._send_json(404, {"error": {"message": "not found"}})
+                return
+            try:
+                request = json.loads(raw or b"{}")
+            except ValueError:
+                self._send_json(400, {"error": {"message": "invalid JSON"}})
+                return
+
+            config.count_request()
+            model = request.get("model", "fake-model")
+            prompt_tokens = sum(
+                len(str(m.get("content", "")).split()) for m in request.get("messages", [])
+            )
+            tokens = config.answer_tokens()
+
+            if request.get("stream"):
+                self._stream(model, tokens)
+                return
+
+            time.sleep(config.ttft + len(tokens) * config.token_delay())
+            self._send_json(200, _completion_body(model, " ".join(tokens), prompt_tokens, len(tokens)))
+
+        def _stream(self, model, tokens):
+            chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            time.sleep(config.ttft)
+            self._event(_chunk_body(chunk_id, model, {"role": "assistant", "content": ""}))
+            delay = config.token_delay()
+            for i, token in enumerate(tokens):
+                self._event(_chunk_body(chunk_id, model, {"content": token if i == 0 else " " + token}))
+                if delay:
+                    time.sleep(delay)
+            self._event(_chunk_body(chunk_id, model, {}, finish_reason="stop"))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+
+        def _event(self, body):
+            self.wfile.write(b"data: " + json.dumps(body).encode("utf-8") + b"\n\n")
+            self.wfile.flush()
+
+    return FakeGroqHandler
+
+
+def start_fake_server(config=None, host="127.0.0.1", port=0):
+    """
+    Start the fake Groq server on a background thread.
+    Args:
+        config (FakeGroqConfig): Latency profile, defaults to ``FakeGroqConfig()``.
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free one.
+    Returns:
+        (server, base_url): The running ``ThreadingHTTPServer`` and its base URL.
+    """
+    config = config or FakeGroqConfig()
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    server.config = config
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{server.server_address[1]}"
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Groq/OpenAI chat completions server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ttft", type=float, default=0.25, help="Seconds before the first token.")
+    parser.add_argument("--tokens-per-second", type=float, default=250.0)
+    parser.add_argument("--completion-tokens", type=int, default=120)
+    args = parser.parse_args()
+
+    config = FakeGroqConfig(args.ttft, args.tokens_per_second, args.completion_tokens)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config))
+    server.daemon_threads = True
+    print(f"Fake Groq server listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
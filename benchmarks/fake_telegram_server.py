@@ -0,0 +1,157 @@
+"""
+Local stand-in for the Telegram Bot API ``sendMessage`` method.
+
+The server accepts ``POST /bot<token>/sendMessage``, records the text it
+received, and can be configured to add latency, fail a fraction of requests
+with 500s, and answer 429 with ``retry_after`` when called more often than a
+minimum interval, like Telegram's per-chat rate limit.
+
+Point the app at it with::
+
+    TELEGRAM_API_BASE=http://127.0.0.1:8766 TELEGRAM_BOT_TOKEN=fake TELEGRAM_CHAT_ID=1 python app.py
+
+or run it standalone::
+
+    python -m benchmarks.fake_telegram_server --port 8766 --failure-rate 0.2
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SEND_PATH = re.compile(r"^/bot[^/]+/sendMessage$")
+
+
+class FakeTelegramConfig:
+    """
+    Behaviour of the fake server.
+    Args:
+        latency (float): Seconds to wait before answering.
+        failure_rate (float): Fraction of requests answered with a 500.
+        min_interval (float): Requests closer together than this get a 429.
+        retry_after (int): ``retry_after`` sent with a 429.
+        seed (int): Seed for the failure draws.
+    """
+
+    def __init__(self, latency=0.05, failure_rate=0.0, min_interval=1.0, retry_after=1, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.min_interval = min_interval
+        self.retry_after = retry_after
+        self.messages = []
+        self.requests_served = 0
+        self.rate_limited = 0
+        self.failed = 0
+        self._last_accepted = 0.0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def admit(self):
+        """Return the HTTP status for the next request and record it."""
+        with self._lock:
+            self.requests_served += 1
+            now = time.monotonic()
+            if now - self._last_accepted < self.min_interval:
+                self.rate_limited += 1
+                return 429
+            if self._random.random() < self.failure_rate:
+                self.failed += 1
+                return 500
+            self._last_accepted = now
+            return 200
+
+
+def make_handler(config):
+    """Build a request handler class bound to ``config``."""
+
+    class FakeTelegramHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, body):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b"{}"
+            if not SEND_PATH.match(self.path):
+                self._send_json(404, {"ok": False, "error_code": 404, "description": "Not Found"})
+                return
+            try:
+                request = json.loads(raw or b"{}")
+            except ValueError:
+                self._send_json(400, {"ok": False, "error_code": 400, "description": "Bad Request"})
+                return
+
+            time.sleep(config.latency)
+            status = config.admit()
+            if status == 429:
+                self._send_json(429, {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": f"Too Many Requests: retry after {config.retry_after}",
+                    "parameters": {"retry_after": config.retry_after},
+                })
+            elif status == 500:
+                self._send_json(500, {"ok": False, "error_code": 500, "description": "Internal Server Error"})
+            else:
+                with config._lock:
+                    config.messages.append(request.get("text", ""))
+                self._send_json(200, {"ok": True, "result": {"message_id": len(config.messages)}})
+
+    return FakeTelegramHandler
+
+
+def start_fake_server(config=None, host="127.0.0.1", port=0):
+    """
+    Start the fake Telegram server on a background thread.
+    Args:
+        config (FakeTelegramConfig): Server behaviour, defaults to ``FakeTelegramConfig()``.
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free one.
+    Returns:
+        (server, base_url): The running ``ThreadingHTTPServer`` and its base URL.
+    """
+    config = config or FakeTelegramConfig()
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    server.config = config
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Telegram Bot API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--min-interval", type=float, default=1.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    config = FakeTelegramConfig(args.latency, args.failure_rate, args.min_interval, args.retry_after)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config))
+    server.daemon_threads = True
+    print(f"Fake Telegram server listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
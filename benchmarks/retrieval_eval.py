@@ -0,0 +1,185 @@
+"""
+Retrieval quality and latency harness over a labelled question set.
+
+Each entry in ``retrieval_labels.json`` maps a question to the resume sections
+(as named by ``utils.resume_sections``) that should be retrieved for it. For a
+given chunking strategy and one or more ``k`` values the harness reports
+recall@k, MRR, the median excerpt size in estimated tokens and retrieval
+latency, and stores the run as JSON under ``benchmarks/results/``::
+
+    python -m benchmarks.retrieval_eval --chunking sections --k 3 5
+    python -m benchmarks.retrieval_eval --chunking recursive --chunk-size 400 --k 5
+    python -m benchmarks.retrieval_eval --section-filter --k 5   # as with RESSY_SECTION_FILTER=1
+    python -m benchmarks.retrieval_eval --diff results/a.json results/b.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from benchmarks.common import summarise_latencies, write_json
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LABELS_PATH = os.path.join(os.path.dirname(__file__), "retrieval_labels.json")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+DIFF_METRICS = ("recall", "mrr", "median_excerpt_tokens", "p50_ms", "p90_ms")
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def chunk_resume(text, chunking, chunk_size, chunk_overlap):
+    """
+    Chunk the resume and tag every chunk with the section it came from.
+    Returns:
+        (texts, metadatas): Parallel lists ready for ``build_retriever``.
+    """
+    from utils import resume_sections
+
+    texts, metadatas = [], []
+    splitter = None
+    if chunking == "recursive":
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    for title, body in resume_sections(text):
+        pieces = splitter.split_text(body) if splitter else [body]
+        texts.extend(pieces)
+        metadatas.extend({"section": title} for _ in pieces)
+    return texts, metadatas
+
+
+def evaluate(retriever, labels, sections_for=None):
+    """
+    Score a retriever against the labelled questions.
+    Args:
+        retriever: Retriever returning documents with a ``section`` metadata key.
+        labels (list): Dicts with ``question`` and expected ``sections``.
+        sections_for (callable): Optional question -> section titles to restrict the search to,
+            as the app does with RESSY_SECTION_FILTER=1 (the lookup is timed too).
+    Returns:
+        report (dict): Aggregate metrics plus per-question detail.
+    """
+    from utils import estimate_tokens
+
+    recalls, reciprocal_ranks, excerpt_tokens, latencies, per_question = [], [], [], [], []
+    for item in labels:
+        expected = set(item["sections"])
+        start = time.perf_counter()
+        sections = sections_for(item["question"]) if sections_for else None
+        if sections:
+            docs = retriever.vectorstore.similarity_search(
+                item["question"], k=retriever.search_kwargs.get("k", 4), filter={"section": {"$in": list(sections)}}
+            )
+        else:
+            docs = retriever.get_relevant_documents(item["question"])
+        latencies.append(time.perf_counter() - start)
+
+        retrieved = [doc.metadata.get("section") for doc in docs]
+        found = expected.intersection(retrieved)
+        rank = next((i for i, section in enumerate(retrieved, 1) if section in expected), None)
+        tokens = estimate_tokens("".join(doc.page_content + "\n\n" for doc in docs))
+
+        recalls.append(len(found) / len(expected))
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+        excerpt_tokens.append(tokens)
+        per_question.append(
+            {"question": item["question"], "retrieved": retrieved, "first_hit_rank": rank, "excerpt_tokens": tokens}
+        )
+
+    latency = summarise_latencies(latencies)
+    return {
+        "recall": statistics.mean(recalls),
+        "mrr": statistics.mean(reciprocal_ranks),
+        "median_excerpt_tokens": statistics.median(excerpt_tokens),
+        "p50_ms": latency["p50_ms"],
+        "p90_ms": latency["p90_ms"],
+        "questions": per_question,
+    }
+
+
+def run(args):
+    from utils import build_retriever, load_text_data, setup_embedding_model
+
+    with open(args.labels, "r", encoding="utf-8") as file:
+        labels = json.load(file)
+    embedding_model = setup_embedding_model(model_name=args.model)
+    resume_text = load_text_data(os.path.join(REPO_ROOT, "data", "resume.txt"))
+    texts, metadatas = chunk_resume(resume_text, args.chunking, args.chunk_size, args.chunk_overlap)
+    sections_for = None
+    if args.section_filter:
+        from entities import EntityIndex
+
+        sections_for = EntityIndex(resume_text).sections_for
+
+    config = {
+        "model": args.model,
+        "chunking": args.chunking,
+        "chunk_size": args.chunk_size if args.chunking == "recursive" else None,
+        "chunk_overlap": args.chunk_overlap if args.chunking == "recursive" else None,
+        "num_chunks": len(texts),
+        "section_filter": args.section_filter,
+    }
+    runs = {}
+    for k in args.k:
+        retriever = build_retriever(
+            embedding_model, texts, k=k, metadatas=metadatas, collection_name=f"eval-{args.chunking}-{k}"
+        )
+        retriever.get_relevant_documents(labels[0]["question"])  # warm up
+        runs[str(k)] = evaluate(retriever, labels, sections_for)
+        report = runs[str(k)]
+        print(
+            f"k={k:<3} recall@k {report['recall']:.3f}  MRR {report['mrr']:.3f}  "
+            f"median excerpt {report['median_excerpt_tokens']:.0f} tok  "
+            f"p50 {report['p50_ms']:.1f} ms  p90 {report['p90_ms']:.1f} ms"
+        )
+
+    output = args.output or os.path.join(
+        RESULTS_DIR,
+        f"retrieval-{args.chunking}{'-filtered' if args.section_filter else ''}-{time.strftime('%Y%m%d-%H%M%S')}.json",
+    )
+    write_json(output, {"config": config, "runs": runs})
+    print(f"Results written to {output}")
+
+
+def diff(old_path, new_path):
+    """Print metric deltas between two stored runs, per shared ``k``."""
+    with open(old_path, "r", encoding="utf-8") as file:
+        old = json.load(file)
+    with open(new_path, "r", encoding="utf-8") as file:
+        new = json.load(file)
+    print(f"old: {old['config']}")
+    print(f"new: {new['config']}")
+    for k in sorted(set(old["runs"]) & set(new["runs"]), key=int):
+        print(f"k={k}")
+        for metric in DIFF_METRICS:
+            before, after = old["runs"][k][metric], new["runs"][k][metric]
+            print(f"  {metric:<22} {before:>9.3f} -> {after:>9.3f} ({after - before:+.3f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate retrieval recall, MRR, excerpt size and latency.")
+    parser.add_argument("--chunking", choices=["sections", "recursive"], default="sections")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--chunk-overlap", type=int, default=50)
+    parser.add_argument("--k", type=int, nargs="+", default=[5])
+    parser.add_argument(
+        "--section-filter", action="store_true",
+        help="Restrict each search to the sections mentioning its known terms, like RESSY_SECTION_FILTER=1.",
+    )
+    parser.add_argument("--model", default="sentence-transformers/all-mpnet-base-v2")
+    parser.add_argument("--labels", default=LABELS_PATH)
+    parser.add_argument("--output", help="Where to store the run (defaults to benchmarks/results/).")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="Compare two stored runs and exit.")
+    args = parser.parse_args()
+
+    if args.diff:
+        diff(*args.diff)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
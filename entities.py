@@ -0,0 +1,313 @@
+"""
+Structured facts extracted from the resume at ingest time.
+
+``EntityIndex`` parses the resume sections into skills (grouped by the
+resume's own headings), roles with dates, education, certifications and
+languages, plus the publications data file. List and lookup questions
+("What tools or frameworks has Akshay used?", "Does Akshay know Docker?")
+are matched with regular expressions and answered from these tables
+without retrieval or an LLM call. Every known term also maps to the resume
+sections that mention it, so retrieval can be narrowed to those sections.
+"""
+import re
+
+from utils import resume_sections
+
+DATE_RANGE = re.compile(r"(?:From:?\s*)?(?P<start>[\w/]+)\s*[–-]\s*(?P<end>[\w/]+)")
+
+# Question shapes answered from the index. Checked in order; the first match wins.
+INTENTS = [
+    ("soft_skills", re.compile(r"\bsoft skills?\b")),
+    ("tools", re.compile(r"\b(tools?|frameworks?|technolog(y|ies)|tech stack)\b")),
+    ("skills", re.compile(r"\bskills?\b")),
+    ("certifications", re.compile(r"\b(certifications?|certificates?|certified)\b")),
+    ("languages", re.compile(r"(?<!programming )\blanguages?\b.*\b(speak|spoken|know)\b|\bspeak\b")),
+    ("publications", re.compile(r"\b(publications?|published (any )?(research|papers?|articles?)|research papers?)\b")),
+    ("roles", re.compile(r"\b(roles?|jobs?|positions?|work experience|work history|employment|worked(?! with| on))\b")),
+    ("education", re.compile(r"\b(study|studied|education|degrees?|universit(y|ies)|academic|masters?|bachelors?)\b")),
+]
+LIST_QUESTION = re.compile(r"^\s*(what|which|list|name|show|give|tell me|where|has|have|does|did)\b")
+# Superlatives and recency ("current job", "latest role") need judgement the tables cannot give
+OPEN_QUESTION = re.compile(
+    r"\b(how|why|explain|describe|compare|match|best|strongest|most|current|currently|latest|recent|recently|last)\b"
+)
+# Negated or forward-looking questions ("skills does Akshay lack", "roles is Akshay looking for")
+# are about what is *not* in the tables, so they always go to the LLM
+NEGATED_OR_FUTURE = re.compile(
+    r"n't\b|\b(not|no|never|lacks?|lacking|missing|without|looking for|seeking|interested|applying|apply|"
+    r"wants?|would|future|plans?|hoping|open to)\b"
+)
+YES_NO_QUESTION = re.compile(r"^\s*(has|have|does|do|did|is|was|can)\b")
+# Intents that may answer a yes/no question: their pattern names the whole category asked about
+YES_NO_INTENTS = ("publications", "certifications", "role_lookup")
+SOFT_SKILLS = re.compile(r"\bsoft\b", re.IGNORECASE)
+LOOKUP_QUESTION = re.compile(
+    r"^\s*(does|has|did|can|is)\s+\w+\s+(know|knows|use|used|have experience (with|in)|worked with|work with|"
+    r"familiar with|proficient (in|with)|experienced (in|with))\s+(?P<term>[^?]+?)\s*\??\s*$"
+)
+QUALIFIER = re.compile(r"\b(?:in|for|with|like|related to|around|at)\s+(?P<topic>[^?.]+)")
+# The category noun of a skills question; words before it ("web frameworks", "cloud tools") qualify it too
+SKILL_NOUN = re.compile(r"\b(skills?|tools?|frameworks?|technolog(y|ies)|tech stack)\b")
+# Words before the noun that do not narrow the groups
+NON_QUALIFIERS = {
+    "what", "which", "list", "name", "show", "give", "tell", "me", "are", "has", "have", "does", "did", "the",
+    "all", "any", "some", "his", "her", "their", "key", "main", "other", "technical", "kind", "kinds", "type",
+    "types", "sort", "sorts", "different", "and", "soft",
+}
+MAX_QUESTION_WORDS = 14
+
+
+def split_items(line):
+    """Split "A, B, C and D" into items; " and " only splits the last element."""
+    parts = [part.strip() for part in line.split(",")]
+    last = re.sub(r"^and\s+", "", parts.pop())
+    parts.extend(re.split(r"\s+and\s+", last))
+    return [part.strip().rstrip(".") for part in parts if part.strip()]
+
+
+def parse_skills(body):
+    """
+    Skills grouped by heading, as {heading: [items]}, e.g. {"Cloud computing": ["Azure", ...]}.
+    Group headings end with ":"; a line without commas after an item list is a
+    subheading, and a heading run into its first item ("Computational chemistry DFT, ...")
+    is split at its last word.
+    """
+    groups, heading, after_heading = {}, None, False
+    for line in body.splitlines()[1:]:
+        line = line.strip()
+        if not line:
+            continue
+        if line.endswith(":"):
+            heading, after_heading = None, False
+            continue
+        if "," not in line and not after_heading:
+            heading, after_heading = line, True
+            continue
+        items = split_items(line)
+        if not after_heading and " " in items[0]:
+            heading, items[0] = items[0].rsplit(" ", 1)
+        group = groups.setdefault(heading or "Other", [])
+        group.extend(item for item in items if item not in group)
+        after_heading = False
+    return groups
+
+
+def parse_blocks(body):
+    """Blank-line separated blocks of a section (minus its title), as lists of stripped lines."""
+    lines = body.splitlines()[1:]
+    blocks, block = [], []
+    for line in lines + [""]:
+        line = line.strip().lstrip("•").strip()
+        if line:
+            block.append(line)
+        elif block:
+            blocks.append(block)
+            block = []
+    return blocks
+
+
+def parse_roles(body):
+    roles = []
+    for block in parse_blocks(body):
+        role = {"title": block[0], "organisation": block[1] if len(block) > 1 else "", "start": "", "end": ""}
+        for line in block[2:]:
+            match = DATE_RANGE.search(line) if line.lower().startswith("from") else None
+            if match:
+                role["start"], role["end"] = match.group("start"), match.group("end")
+            elif line.lower().startswith("job description:"):
+                role["description"] = line.split(":", 1)[1].strip()
+        roles.append(role)
+    return roles
+
+
+def parse_titled_entries(body):
+    """Entries shaped "Name | Date" followed by an issuer/institution line and details."""
+    entries = []
+    for block in parse_blocks(body):
+        name, _, date = block[0].partition("|")
+        entries.append({
+            "name": name.strip(),
+            "date": date.strip(),
+            "by": block[1] if len(block) > 1 else "",
+            "details": block[2:],
+        })
+    return entries
+
+
+class EntityIndex:
+    """
+    Lookup tables built from the resume and publications.
+    Args:
+        resume_text (str): Full resume text.
+        publications (list): Publication dicts as returned by ``load_publications``.
+        first_name (str): Name used in generated answers.
+    """
+
+    def __init__(self, resume_text, publications=(), first_name="Akshay"):
+        self.first_name = first_name
+        sections = dict(resume_sections(resume_text))
+        self.skills = parse_skills(sections.get("SKILLS", ""))
+        self.roles = parse_roles(sections.get("EXPERIENCE", ""))
+        self.education = parse_titled_entries(sections.get("ACADEMIC BACKGROUND", ""))
+        self.certifications = parse_titled_entries(sections.get("CERTIFICATIONS", ""))
+        self.languages = [line.strip("• ").strip() for line in sections.get("LANGUAGES", "").splitlines()[1:] if line.strip()]
+        self.publications = [p for p in publications if p.get("link") and p.get("type", "publication") in ("publication", "app")]
+
+        # term (lower case) -> (display name, skill heading); term -> sections mentioning it
+        self.terms = {}
+        for heading, items in self.skills.items():
+            for item in items:
+                self.terms.setdefault(item.lower(), (item, heading))
+        for role in self.roles:
+            organisation = role["organisation"].split(",")[0].strip()
+            if organisation:
+                self.terms.setdefault(organisation.lower(), (organisation, None))
+        self.term_sections = {
+            term: [title for title, body in sections.items() if re.search(rf"(?<!\w){re.escape(term)}(?!\w)", body.lower())]
+            for term in self.terms
+        }
+        self._longest_term = max((len(term.split()) for term in self.terms), default=1)
+
+    def find_terms(self, text):
+        """Known terms mentioned in ``text``, found by n-gram dictionary lookups."""
+        words = re.findall(r"[\w#+./-]+", text.lower())
+        found = []
+        for size in range(min(self._longest_term, len(words)), 0, -1):
+            for i in range(len(words) - size + 1):
+                term = " ".join(words[i:i + size]).rstrip(".")
+                if term in self.terms and term not in found:
+                    found.append(term)
+        return found
+
+    def sections_for(self, question):
+        """Resume sections mentioning the terms in ``question``, for filtering retrieval."""
+        sections = []
+        for term in self.find_terms(question):
+            sections.extend(title for title in self.term_sections[term] if title not in sections)
+        return sections
+
+    def intent(self, question):
+        """Return the intent name for a list/lookup question, or None."""
+        text = question.lower().strip()
+        if len(text.split()) > MAX_QUESTION_WORDS or OPEN_QUESTION.search(text) or NEGATED_OR_FUTURE.search(text):
+            return None
+        lookup = LOOKUP_QUESTION.match(text)
+        if lookup and lookup.group("term").strip().rstrip(".") in self.terms:
+            return "lookup"
+        if not LIST_QUESTION.match(text):
+            return None
+        for name, pattern in INTENTS:
+            if pattern.search(text):
+                # "worked at X" / "role at X" is a lookup when X is a known employer
+                if name == "roles" and self.find_terms(text):
+                    name = "role_lookup"
+                # "Has Akshay worked at Google?" must not be answered with the whole work history
+                if YES_NO_QUESTION.match(text) and name not in YES_NO_INTENTS:
+                    return None
+                return name
+        return None
+
+    def answer(self, question):
+        """
+        Answer a list or lookup question from the index.
+        Returns:
+            answer (str): Markdown answer, or None if the question needs retrieval and the LLM.
+        """
+        intent = self.intent(question)
+        if intent is None:
+            return None
+        return getattr(self, f"_answer_{intent}")(question)
+
+    def _bullets(self, lines):
+        return "\n".join(f"- {line}" for line in lines)
+
+    def _skill_lines(self, question, headings=None):
+        groups = [(heading, items) for heading, items in self.skills.items() if headings is None or heading in headings]
+        text = question.lower()
+        # "skills in machine learning" / "web frameworks" -> only headings sharing a word with the qualifier
+        topic = set()
+        qualifier = QUALIFIER.search(text)
+        if qualifier:
+            topic |= {word for word in re.findall(r"\w+", qualifier.group("topic")) if len(word) > 2}
+        noun = SKILL_NOUN.search(text)
+        if noun:
+            before = re.findall(r"\w+", re.sub(r"'s\b", "", text[:noun.start()]))
+            topic |= {word for word in before if len(word) > 2 and word not in NON_QUALIFIERS} - {self.first_name.lower()}
+        if topic:
+            narrowed = [(heading, items) for heading, items in groups if topic & set(re.findall(r"\w+", heading.lower()))]
+            # A qualifier that matches no group, or every group, is not one the tables understand
+            if len(narrowed) == len(groups):
+                return None
+            groups = narrowed
+        if not groups:
+            return None
+        return self._bullets(f"**{heading}:** {', '.join(items)}" for heading, items in groups)
+
+    def _answer_skills(self, question):
+        body = self._skill_lines(question)
+        return body and f"{self.first_name}'s skills, grouped as on the resume:\n\n{body}"
+
+    def _answer_tools(self, question):
+        technical = [heading for heading in self.skills if not SOFT_SKILLS.search(heading)]
+        body = self._skill_lines(question, technical)
+        return body and f"Here are the tools, frameworks and technologies {self.first_name} has worked with:\n\n{body}"
+
+    def _answer_soft_skills(self, question):
+        body = self._skill_lines(question, [heading for heading in self.skills if SOFT_SKILLS.search(heading)])
+        return body and f"{self.first_name}'s soft skills:\n\n{body}"
+
+    def _answer_lookup(self, question):
+        term = LOOKUP_QUESTION.match(question.lower().strip()).group("term").strip().rstrip(".")
+        name, heading = self.terms[term]
+        if heading is None:
+            return None
+        return f"Yes. {name} is listed in {self.first_name}'s skills, under {heading}."
+
+    def _role_line(self, role):
+        dates = f" ({role['start']} – {role['end']})" if role["start"] else ""
+        return f"**{role['title']}**, {role['organisation']}{dates}"
+
+    def _answer_roles(self, question):
+        if not self.roles:
+            return None
+        return f"{self.first_name}'s work experience:\n\n" + self._bullets(self._role_line(role) for role in self.roles)
+
+    def _answer_role_lookup(self, question):
+        terms = set(self.find_terms(question))
+        roles = [role for role in self.roles if role["organisation"].split(",")[0].strip().lower() in terms]
+        if not roles:
+            return None
+        lines = [self._role_line(role) + (f": {role['description']}" if role.get("description") else "") for role in roles]
+        return self._bullets(lines)
+
+    def _answer_education(self, question):
+        # "Where did Akshay study for his Masters?" -> only the matching degree
+        words = set(re.findall(r"\w+", question.lower()))
+        entries = [entry for entry in self.education if words & set(re.findall(r"\w+", entry["name"].lower())) - {"in", "of"}]
+        entries = entries or self.education
+        if not entries:
+            return None
+        lines = []
+        for entry in entries:
+            details = "; ".join(entry["details"])
+            lines.append(f"**{entry['name']}** ({entry['date']}), {entry['by']}" + (f". {details}" if details else ""))
+        return f"{self.first_name}'s education:\n\n" + self._bullets(lines)
+
+    def _answer_certifications(self, question):
+        if not self.certifications:
+            return None
+        lines = [f"**{entry['name']}**, {entry['by']} ({entry['date']})" for entry in self.certifications]
+        return f"{self.first_name} holds these certifications:\n\n" + self._bullets(lines)
+
+    def _answer_languages(self, question):
+        if not self.languages:
+            return None
+        return f"{self.first_name} speaks {', '.join(self.languages[:-1])} and {self.languages[-1]}." if len(
+            self.languages
+        ) > 1 else f"{self.first_name} speaks {self.languages[0]}."
+
+    def _answer_publications(self, question):
+        if not self.publications:
+            return None
+        lines = [f"{p['title']}" + (f" ({p['link']})" if p.get("link") else "") for p in self.publications]
+        return f"{self.first_name}'s published work:\n\n" + self._bullets(lines)
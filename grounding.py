@@ -0,0 +1,126 @@
+"""
+Local grounding check for generated answers.
+
+Instead of asking the LLM to verify its own answer, ``GroundingChecker``
+embeds the answer's sentences in one batch and compares them with the
+sentences of the excerpts the answer was generated from, plus any extra
+evidence such as the job description being matched (cosine similarity, one
+matrix product). Links and DOIs in the answer must appear verbatim in
+the excerpts or in the known publication links. Sentences that fail either
+test are reported as unsupported.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from metrics import metrics
+from resume_index import content_hash
+
+URL_PATTERN = re.compile(r"(?:https?://|www\.)[^\s<>()\[\]\"']+", re.IGNORECASE)
+DOI_PATTERN = re.compile(r"\b10\.\d{4,9}/[^\s<>()\[\]\"']+", re.IGNORECASE)
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+MARKUP = re.compile(r"^\s*(?:[-*•>#]+|\d+[.)])\s+|\*\*|__|`")
+
+
+def normalise_link(link):
+    """Compare links without scheme, "www.", case or trailing punctuation."""
+    link = link.lower().rstrip(".,;:!?/")
+    link = re.sub(r"^https?://", "", link)
+    return link[4:] if link.startswith("www.") else link
+
+
+def extract_links(text):
+    """Normalised URLs and DOIs mentioned in ``text``."""
+    return {normalise_link(match) for pattern in (URL_PATTERN, DOI_PATTERN) for match in pattern.findall(text)}
+
+
+def split_sentences(text, min_words=1):
+    """Sentences and list items of ``text`` with Markdown markers stripped."""
+    sentences = (MARKUP.sub("", part).strip() for part in SENTENCE_SPLIT.split(text))
+    return [sentence for sentence in sentences if len(sentence.split()) >= min_words]
+
+
+class GroundingChecker:
+    """
+    Flags answer sentences that the retrieved excerpts do not support.
+    Args:
+        embedding_model: Embeddings used for answers and excerpts (any LangChain ``Embeddings``).
+        threshold (float): Minimum cosine similarity to the closest excerpt sentence.
+        min_words (int): Shorter answer sentences (greetings, sign-offs) are only checked for links.
+        cache_size (int): Excerpt sentence vectors kept between answers.
+    """
+
+    def __init__(self, embedding_model, threshold=0.45, min_words=5, cache_size=4096):
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.min_words = min_words
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _embed(self, claims, evidence):
+        # One embedding call for the answer plus any excerpt sentences not seen before
+        keys = [content_hash(text) for text in evidence]
+        with self._lock:
+            missing = {key: text for key, text in zip(keys, evidence) if key not in self._cache}
+        vectors = self.embedding_model.embed_documents(claims + list(missing.values()))
+        claim_vectors, new_vectors = vectors[:len(claims)], vectors[len(claims):]
+        with self._lock:
+            for key, vector in zip(missing, new_vectors):
+                self._cache[key] = vector
+            evidence_vectors = [self._cache[key] for key in keys]
+            for key in keys:
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return np.asarray(claim_vectors, dtype=np.float32), np.asarray(evidence_vectors, dtype=np.float32)
+
+    def check(self, answer, relevant_excerpts, known_links=(), extra_evidence=""):
+        """
+        Check an answer against the excerpts it was generated from.
+        Args:
+            answer (str): Generated answer.
+            relevant_excerpts (str): Excerpts passed to the LLM for this answer.
+            known_links (iterable): Further links the answer may cite, e.g. publication links.
+            extra_evidence (str): Other text given to the LLM that the answer may restate,
+                e.g. the job description for a JD match.
+        Returns:
+            report (dict): "grounded" (bool), "checked" (number of sentences checked) and
+                "unsupported", a list of {"sentence", "score", "reason"} where reason is
+                "low_similarity" or "unknown_link" (score is None for the latter).
+        """
+        start = time.perf_counter()
+        sentences = [sentence for sentence in split_sentences(answer) if not sentence.endswith("?")]
+        evidence = split_sentences(relevant_excerpts) + split_sentences(extra_evidence)
+        allowed_links = extract_links(relevant_excerpts) | extract_links(extra_evidence)
+        for link in known_links:
+            allowed_links |= extract_links(link)
+
+        # Links are checked in every sentence, similarity only in sentences long enough to make a claim
+        unsupported = [
+            {"sentence": sentence, "score": None, "reason": "unknown_link"}
+            for sentence in sentences if extract_links(sentence) - allowed_links
+        ]
+        flagged = {item["sentence"] for item in unsupported}
+        claims = [s for s in sentences if s not in flagged and len(s.split()) >= self.min_words]
+        if claims:
+            scores = np.zeros(len(claims), dtype=np.float32)
+            if evidence:
+                claim_vectors, evidence_vectors = self._embed(claims, evidence)
+                claim_vectors /= np.clip(np.linalg.norm(claim_vectors, axis=1, keepdims=True), 1e-12, None)
+                evidence_vectors /= np.clip(np.linalg.norm(evidence_vectors, axis=1, keepdims=True), 1e-12, None)
+                scores = (claim_vectors @ evidence_vectors.T).max(axis=1)
+            unsupported += [
+                {"sentence": sentence, "score": round(score, 3), "reason": "low_similarity"}
+                for sentence, score in zip(claims, scores.tolist()) if score < self.threshold
+            ]
+
+        metrics.observe("grounding_seconds", time.perf_counter() - start)
+        metrics.incr("grounding_checked_sentences", len(sentences))
+        metrics.incr("grounding_unsupported_sentences", len(unsupported))
+        if unsupported:
+            metrics.incr("grounding_flagged_answers")
+        return {"grounded": not unsupported, "checked": len(sentences), "unsupported": unsupported}
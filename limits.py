@@ -0,0 +1,178 @@
+"""
+Server-side guards for oversized inputs and traffic bursts.
+
+``InputPolicy`` bounds what reaches the embedding model and the LLM prompt:
+inputs over a hard limit are rejected outright, and inputs over the soft
+token budget are either truncated (head and tail kept) or reduced
+extractively to the sentences that look most like requirements.
+``AdmissionController`` bounds concurrent work and the number of requests
+allowed to wait for it; beyond that, requests are shed immediately with
+``Overloaded`` so callers can answer "busy" fast instead of queueing.
+"""
+import re
+import threading
+import time
+
+from metrics import metrics
+from utils import estimate_tokens
+
+# Cues that a sentence of a pasted job description carries requirements
+REQUIREMENT_CUES = re.compile(
+    r"\b(require[sd]?|requirements?|must|essential|desirable|experience|proficien\w*|knowledge|skills?|"
+    r"familiar\w*|degree|years?|responsib\w*|you will|you'll|qualification\w*|bonus|plus|stack)\b",
+    re.IGNORECASE,
+)
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+class InputTooLarge(ValueError):
+    pass
+
+
+class Overloaded(RuntimeError):
+    pass
+
+
+class InputPolicy:
+    """
+    Size policy for user input.
+    Args:
+        max_tokens (int): Soft budget (estimated tokens) for text sent downstream.
+        hard_max_chars (int): Inputs longer than this are rejected.
+        mode (str): "extract" keeps the most requirement-like sentences,
+            "truncate" keeps the head and tail, "reject" refuses anything over budget.
+    """
+
+    def __init__(self, max_tokens=600, hard_max_chars=20000, mode="extract"):
+        if mode not in ("extract", "truncate", "reject"):
+            raise ValueError(f"Unknown input policy mode: {mode}")
+        self.max_tokens = max_tokens
+        self.hard_max_chars = hard_max_chars
+        self.mode = mode
+
+    def apply(self, text):
+        """
+        Return ``text`` reduced to the token budget.
+        Raises:
+            InputTooLarge: If the input exceeds the hard limit, or the budget in "reject" mode.
+        """
+        if len(text) > self.hard_max_chars:
+            metrics.incr("input_rejected")
+            raise InputTooLarge(f"Input is {len(text)} characters; the limit is {self.hard_max_chars}.")
+        if estimate_tokens(text) <= self.max_tokens:
+            return text
+        if self.mode == "reject":
+            metrics.incr("input_rejected")
+            raise InputTooLarge(f"Input is longer than {self.max_tokens} tokens.")
+        metrics.incr("input_extracted" if self.mode == "extract" else "input_truncated")
+        return self.extract(text) if self.mode == "extract" else self.truncate(text)
+
+    def truncate(self, text):
+        """Keep about two thirds of the token budget from the head and the rest from the tail."""
+        if estimate_tokens(text) <= self.max_tokens:
+            return text
+        words = text.split()
+        budget = self.max_tokens - 1  # the "…" marker
+        head, used = 0, 0
+        while head < len(words) and used + estimate_tokens(words[head]) <= budget * 2 // 3:
+            used += estimate_tokens(words[head])
+            head += 1
+        tail = len(words)
+        while tail > head and used + estimate_tokens(words[tail - 1]) <= budget:
+            used += estimate_tokens(words[tail - 1])
+            tail -= 1
+        # head and tail never overlap: tail starts at or after the end of the head
+        tail = max(head, tail)
+        return " ".join(words[:head]) + " … " + " ".join(words[tail:])
+
+    def extract(self, text):
+        """
+        Keep the opening sentence (usually the job title) plus the sentences with
+        the most requirement cues, in their original order, within the budget.
+        """
+        sentences = [s.strip() for s in SENTENCE_SPLIT.split(text) if s.strip()]
+        if not sentences:
+            return self.truncate(text)
+        ranked = sorted(
+            range(1, len(sentences)),
+            key=lambda i: (-len(REQUIREMENT_CUES.findall(sentences[i])), i),
+        )
+        keep, used = {0}, estimate_tokens(sentences[0])
+        for i in ranked:
+            cost = estimate_tokens(sentences[i])
+            if used + cost > self.max_tokens:
+                continue
+            keep.add(i)
+            used += cost
+        if used > self.max_tokens:
+            return self.truncate(text)
+        return " ".join(sentences[i] for i in sorted(keep))
+
+
+class AdmissionController:
+    """
+    Bounded concurrency with load shedding.
+    Args:
+        max_concurrent (int): Requests doing work at once.
+        max_waiting (int): Requests allowed to wait for a slot; more are shed at once.
+        wait_timeout (float): Seconds a waiting request may wait before it is shed.
+    """
+
+    def __init__(self, max_concurrent=4, max_waiting=16, wait_timeout=15.0):
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._in_flight = 0
+
+    def check(self):
+        """
+        Shed early if the waiting room is already full, without taking a slot.
+        Raises:
+            Overloaded: If too many requests are already waiting.
+        """
+        with self._lock:
+            if self._waiting >= self.max_waiting:
+                metrics.incr("requests_shed")
+                raise Overloaded("Too many requests are waiting.")
+
+    def acquire(self):
+        """
+        Take a work slot, waiting up to ``wait_timeout``.
+        Raises:
+            Overloaded: If too many requests are already waiting or the wait times out.
+        """
+        with self._lock:
+            if self._waiting >= self.max_waiting:
+                metrics.incr("requests_shed")
+                raise Overloaded("Too many requests are waiting.")
+            self._waiting += 1
+            metrics.gauge("admission_waiting", self._waiting)
+        start = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.wait_timeout)
+        with self._lock:
+            self._waiting -= 1
+            if acquired:
+                self._in_flight += 1
+            metrics.gauge("admission_waiting", self._waiting)
+            metrics.gauge("admission_in_flight", self._in_flight)
+        metrics.observe("admission_wait_seconds", time.perf_counter() - start)
+        if not acquired:
+            metrics.incr("requests_shed")
+            raise Overloaded("Timed out waiting for a free worker.")
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+            metrics.gauge("admission_in_flight", self._in_flight)
+        self._slots.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+        return False
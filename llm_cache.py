@@ -0,0 +1,159 @@
+"""
+Persistent cache for LLM answers.
+
+Answers are stored zlib-compressed in SQLite, keyed deterministically on the
+model, a hash of the system prompt, the user question and the exact excerpt
+text, so they survive restarts and any change to the resume data produces a
+new key. The file is kept under a size budget by evicting least recently used
+entries, and on start-up the most frequently hit entries are preloaded into
+an in-memory LRU. Hit counts and access times are kept in memory and written
+to SQLite in batches, so a cache hit never waits on a disk commit.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from metrics import metrics
+
+
+def cache_key(model, system_prompt, user_question, relevant_excerpts, first_name=""):
+    """Deterministic key for one completion request."""
+    system_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+    material = "\0".join([model, system_hash, first_name, user_question, relevant_excerpts])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed answer cache with an in-memory LRU in front.
+    Args:
+        path (str): SQLite file.
+        max_bytes (int): Budget for the compressed answers stored on disk.
+        memory_entries (int): Answers kept decompressed in memory.
+        warm_entries (int): Most-hit answers preloaded into memory on start-up.
+        flush_entries (int): Pending hit counts that trigger a write to SQLite.
+        flush_interval (float): Maximum seconds hit counts stay pending while hits keep arriving.
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024, memory_entries=1024, warm_entries=256,
+                 flush_entries=64, flush_interval=30.0):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.flush_entries = flush_entries
+        self.flush_interval = flush_interval
+        self._memory = OrderedDict()
+        self._pending_hits = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, answer BLOB NOT NULL, size INTEGER NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0, created REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._db.commit()
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.warm(warm_entries)
+
+    def warm(self, entries):
+        """Preload the ``entries`` most frequently hit answers into memory."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, answer FROM responses ORDER BY hits DESC, last_access DESC LIMIT ?", (entries,)
+            ).fetchall()
+            for key, blob in reversed(rows):
+                self._remember(key, zlib.decompress(blob).decode("utf-8"))
+        metrics.gauge("llm_cache_warm_entries", len(rows))
+
+    def _remember(self, key, answer):
+        self._memory[key] = answer
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached answer for ``key``, or None."""
+        with self._lock:
+            answer = self._memory.get(key)
+            if answer is not None:
+                self._memory.move_to_end(key)
+            else:
+                row = self._db.execute("SELECT answer FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    answer = zlib.decompress(row[0]).decode("utf-8")
+                    self._remember(key, answer)
+            if answer is None:
+                metrics.incr("llm_cache_misses")
+                return None
+            hits, _ = self._pending_hits.get(key, (0, None))
+            self._pending_hits[key] = (hits + 1, time.time())
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            if due or len(self._pending_hits) >= self.flush_entries:
+                self._flush_hits()
+        metrics.incr("llm_cache_hits")
+        return answer
+
+    def flush(self):
+        """Write pending hit counts to SQLite."""
+        with self._lock:
+            self._flush_hits()
+
+    def _flush_hits(self):
+        """Caller holds the lock."""
+        self._last_flush = time.monotonic()
+        if not self._pending_hits:
+            return
+        self._db.executemany(
+            "UPDATE responses SET hits = hits + ?, last_access = ? WHERE key = ?",
+            [(hits, last_access, key) for key, (hits, last_access) in self._pending_hits.items()],
+        )
+        self._db.commit()
+        self._pending_hits.clear()
+
+    def put(self, key, answer):
+        """Store an answer, evicting least recently used entries over the size budget."""
+        blob = zlib.compress(answer.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            # Eviction orders by last_access, so it must see recent hits
+            self._pending_hits.pop(key, None)
+            self._flush_hits()
+            previous = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, answer, size, hits, created, last_access)"
+                " VALUES (?, ?, ?, 0, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._size += len(blob) - (previous[0] if previous else 0)
+            self._remember(key, answer)
+            self._evict()
+            self._db.commit()
+        metrics.gauge("llm_cache_bytes", self._size)
+
+    def _evict(self):
+        """Delete least recently used rows until under budget. Caller holds the lock."""
+        while self._size > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._memory.pop(key, None)
+                self._size -= size
+                metrics.incr("llm_cache_evictions")
+                if self._size <= self.max_bytes:
+                    break
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,77 @@
+"""
+In-process metrics registry.
+
+Counters, gauges and timings are kept in memory so they can be logged or
+exposed by the app without an external metrics backend. Timings keep a
+bounded window of recent samples for percentiles.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+TIMING_WINDOW = 1024
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._timings = {}
+
+    def incr(self, name, value=1):
+        """Increase counter ``name`` by ``value``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def gauge(self, name, value):
+        """Set gauge ``name`` to ``value``."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name, seconds):
+        """Record one duration sample (in seconds) for timing ``name``."""
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = {"count": 0, "total": 0.0, "max": 0.0, "recent": deque(maxlen=TIMING_WINDOW)}
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+            timing["recent"].append(seconds)
+
+    @contextmanager
+    def timer(self, name):
+        """Context manager recording the duration of its block under ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def counter(self, name):
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self):
+        """
+        Return a JSON-serialisable copy of all metrics.
+        Timings are summarised as count, mean, p50, p95 and max in milliseconds.
+        """
+        with self._lock:
+            timings = {}
+            for name, timing in self._timings.items():
+                recent = sorted(timing["recent"])
+                timings[name] = {
+                    "count": timing["count"],
+                    "mean_ms": 1000.0 * timing["total"] / timing["count"],
+                    "p50_ms": 1000.0 * recent[int(0.50 * (len(recent) - 1))],
+                    "p95_ms": 1000.0 * recent[int(0.95 * (len(recent) - 1))],
+                    "max_ms": 1000.0 * timing["max"],
+                }
+            return {"counters": dict(self._counters), "gauges": dict(self._gauges), "timings": timings}
+
+
+# Shared registry used across the app
+metrics = Metrics()
@@ -0,0 +1,253 @@
+"""
+Durable outbox for contact messages.
+
+``ContactOutbox.enqueue`` writes the message to SQLite and returns at once;
+a background thread delivers queued messages through a sender such as
+``TelegramSender``. Messages waiting at the same time are coalesced into a
+single Telegram message (up to Telegram's 4096-character limit), sends are
+spaced at least ``min_interval`` apart, failures are retried with
+exponential backoff and a 429 ``retry_after`` pauses the whole outbox.
+Undelivered messages survive restarts.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_MAX_CHARS = 4096
+MAX_MESSAGE_CHARS = 4000
+SEPARATOR = "\n\n— — —\n\n"
+
+
+class DeliveryError(Exception):
+    """A send failed. ``retry_after`` is set when the API asked us to slow down."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TelegramSender:
+    """
+    Sends text to one Telegram chat.
+    Args:
+        token (str): Bot token.
+        chat_id (str): Target chat.
+        api_base (str): API root, overridable to point at a fake server.
+        timeout (float): Request timeout in seconds.
+    """
+
+    def __init__(self, token, chat_id, api_base="https://api.telegram.org", timeout=10.0):
+        self.url = f"{api_base.rstrip('/')}/bot{token}/sendMessage"
+        self.chat_id = chat_id
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    def __call__(self, text):
+        try:
+            response = self._session.post(self.url, json={"chat_id": self.chat_id, "text": text}, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise DeliveryError(f"Network error: {e}")
+        if response.status_code == 200:
+            return
+        retry_after = None
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.json()["parameters"]["retry_after"])
+            except (ValueError, KeyError, TypeError):
+                retry_after = float(response.headers.get("Retry-After") or 1)
+        raise DeliveryError(f"{response.status_code} - {response.text}", retry_after)
+
+
+def format_batch(texts):
+    """Telegram message text for one or more contact messages."""
+    if len(texts) == 1:
+        return f"🌐 New Contact Message:\n\n{texts[0]}"
+    return f"🌐 {len(texts)} New Contact Messages:\n\n" + SEPARATOR.join(texts)
+
+
+class ContactOutbox:
+    """
+    SQLite-backed outbox with a background sender.
+    Args:
+        db_path (str): SQLite file holding the outbox.
+        send (callable): text -> None; raises DeliveryError on failure.
+        min_interval (float): Minimum seconds between sends.
+        max_attempts (int): Attempts before a message is marked failed.
+        base_backoff (float): First retry delay in seconds, doubled on every failure.
+        max_backoff (float): Cap on the retry delay.
+    """
+
+    def __init__(self, db_path, send, min_interval=1.0, max_attempts=8, base_backoff=2.0, max_backoff=300.0):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.send = send
+        self.min_interval = min_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, text TEXT NOT NULL, status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0, next_attempt REAL NOT NULL, created REAL NOT NULL,"
+            " delivered REAL, last_error TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt)")
+        self._db.commit()
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._stopped = False
+        self._paused_until = 0.0
+        self._last_send = 0.0
+        self._thread = None
+
+    def enqueue(self, text):
+        """
+        Store a message for delivery.
+        Returns:
+            message_id (int): Id for ``status``.
+        Raises:
+            ValueError: If the message is empty or longer than MAX_MESSAGE_CHARS.
+        """
+        text = text.strip()
+        if not text:
+            raise ValueError("Please enter a message before submitting")
+        if len(text) > MAX_MESSAGE_CHARS:
+            raise ValueError(f"Message is too long ({len(text)} characters, limit {MAX_MESSAGE_CHARS})")
+        now = time.time()
+        with self._wake:
+            cursor = self._db.execute(
+                "INSERT INTO outbox (text, status, next_attempt, created) VALUES (?, 'queued', ?, ?)",
+                (text, now, now),
+            )
+            self._db.commit()
+            self._wake.notify()
+        metrics.incr("contact_enqueued")
+        return cursor.lastrowid
+
+    def status(self, message_id):
+        """Return {"id", "status", "attempts", "created", "delivered", "last_error"} or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, attempts, created, delivered, last_error FROM outbox WHERE id = ?",
+                (message_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "status", "attempts", "created", "delivered", "last_error"), row))
+
+    def pending(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox WHERE status = 'queued'").fetchone()[0]
+
+    def _next_batch(self, now):
+        """Due messages, oldest first, that fit in one Telegram message. Caller holds the lock."""
+        rows = self._db.execute(
+            "SELECT id, text FROM outbox WHERE status = 'queued' AND next_attempt <= ? ORDER BY id LIMIT 100",
+            (now,),
+        ).fetchall()
+        batch = []
+        for row in rows:
+            if batch and len(format_batch([text for _, text in batch + [row]])) > TELEGRAM_MAX_CHARS:
+                break
+            batch.append(row)
+        return batch
+
+    def _wait_time(self, now):
+        """Seconds until the next send may happen, or None if nothing is queued. Caller holds the lock."""
+        row = self._db.execute("SELECT MIN(next_attempt) FROM outbox WHERE status = 'queued'").fetchone()
+        if row[0] is None:
+            return None
+        return max(row[0], self._paused_until, self._last_send + self.min_interval) - now
+
+    def deliver_once(self):
+        """
+        Send one batch if one is due.
+        Returns:
+            delivered (int): Number of contact messages delivered.
+        """
+        with self._lock:
+            batch = self._next_batch(time.time())
+        if not batch:
+            return 0
+        ids = [message_id for message_id, _ in batch]
+        start = time.perf_counter()
+        try:
+            self.send(format_batch([text for _, text in batch]))
+            error = None
+        except DeliveryError as e:
+            error = e
+        now = time.time()
+        metrics.observe("contact_send_seconds", time.perf_counter() - start)
+
+        with self._lock:
+            self._last_send = now
+            placeholders = ",".join("?" * len(ids))
+            if error is None:
+                self._db.execute(
+                    f"UPDATE outbox SET status = 'delivered', attempts = attempts + 1, delivered = ?"
+                    f" WHERE id IN ({placeholders})",
+                    [now] + ids,
+                )
+            elif error.retry_after is not None:
+                # Rate limited: pause everything, and don't count it as a failed attempt
+                self._paused_until = now + error.retry_after
+                self._db.execute(
+                    f"UPDATE outbox SET next_attempt = ?, last_error = ? WHERE id IN ({placeholders})",
+                    [self._paused_until, str(error)] + ids,
+                )
+            else:
+                for message_id in ids:
+                    attempts = self._db.execute("SELECT attempts FROM outbox WHERE id = ?", (message_id,)).fetchone()[0] + 1
+                    delay = min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+                    self._db.execute(
+                        "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                        ("failed" if attempts >= self.max_attempts else "queued", attempts, now + delay, str(error), message_id),
+                    )
+            self._db.commit()
+
+        if error is None:
+            metrics.incr("contact_delivered", len(ids))
+            metrics.incr("contact_api_calls")
+            return len(ids)
+        metrics.incr("contact_rate_limited" if error.retry_after is not None else "contact_send_failures")
+        logger.warning("Contact delivery failed for %d message(s): %s", len(ids), error)
+        return 0
+
+    def run(self):
+        """Deliver messages until ``stop`` is called."""
+        while True:
+            with self._wake:
+                while not self._stopped:
+                    wait = self._wait_time(time.time())
+                    if wait is not None and wait <= 0:
+                        break
+                    self._wake.wait(wait)
+                if self._stopped:
+                    return
+            try:
+                self.deliver_once()
+            except Exception:
+                logger.exception("Contact outbox sender failed")
+                time.sleep(self.min_interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="contact-outbox", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._wake:
+            self._stopped = True
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
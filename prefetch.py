@@ -0,0 +1,129 @@
+"""
+Speculative retrieval while the user is typing.
+
+The UI reports partial input as it changes; after a short debounce the
+prefetcher runs retrieval on the partial text in the background. When the
+message is submitted, the prefetched excerpts are reused if the final text is
+close enough to what was prefetched, taking the embedding + search cost off
+the critical path. Hit rate and the retrieval time saved are recorded in the
+metrics registry.
+"""
+import difflib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import metrics
+
+
+def normalise_query(text):
+    """Lower-case, collapse whitespace and drop trailing punctuation."""
+    return re.sub(r"\s+", " ", text).strip().lower().rstrip("?!. ")
+
+
+class Prefetch:
+    def __init__(self, text, future):
+        self.text = text
+        self.future = future
+        self.started = time.perf_counter()
+        self.duration = None
+
+
+class RetrievalPrefetcher:
+    """
+    Debounced background retrieval keyed by session.
+    Args:
+        search (callable): text -> excerpts, the same retrieval used on submit.
+        debounce (float): Seconds the input must be idle before prefetching.
+        min_chars (int): Partial inputs shorter than this are ignored.
+        similarity (float): Minimum difflib ratio between the prefetched and final text for reuse.
+        max_sessions (int): Pending prefetches kept before the oldest are dropped.
+        workers (int): Background retrieval threads.
+    """
+
+    def __init__(self, search, debounce=0.35, min_chars=12, similarity=0.92, max_sessions=512, workers=2):
+        self.search = search
+        self.debounce = debounce
+        self.min_chars = min_chars
+        self.similarity = similarity
+        self.max_sessions = max_sessions
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._timers = {}
+        self._prefetches = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, session_id, text):
+        """Record the latest partial input for a session and (re)arm its debounce timer."""
+        with self._lock:
+            timer = self._timers.pop(session_id, None)
+            if timer is not None:
+                timer.cancel()
+            if len(text.strip()) < self.min_chars:
+                return
+            current = self._prefetches.get(session_id)
+            if current is not None and normalise_query(current.text) == normalise_query(text):
+                return
+            timer = threading.Timer(self.debounce, self._start, (session_id, text))
+            timer.daemon = True
+            self._timers[session_id] = timer
+        timer.start()
+
+    def _start(self, session_id, text):
+        def run():
+            start = time.perf_counter()
+            result = self.search(text)
+            prefetch.duration = time.perf_counter() - start
+            return result
+
+        with self._lock:
+            if self._timers.get(session_id) is not threading.current_thread():
+                return
+            del self._timers[session_id]
+            prefetch = Prefetch(text, None)
+            prefetch.future = self._executor.submit(run)
+            self._prefetches[session_id] = prefetch
+            self._prefetches.move_to_end(session_id)
+            while len(self._prefetches) > self.max_sessions:
+                self._prefetches.popitem(last=False)
+        metrics.incr("prefetch_started")
+
+    def is_close(self, prefetched, final):
+        a, b = normalise_query(prefetched), normalise_query(final)
+        return a == b or difflib.SequenceMatcher(None, a, b).ratio() >= self.similarity
+
+    def take(self, session_id, text):
+        """
+        Return prefetched excerpts for the submitted ``text``, or None on a miss.
+        A matching prefetch that is still running is waited for, since it has
+        already done part of the work.
+        """
+        with self._lock:
+            timer = self._timers.pop(session_id, None)
+            if timer is not None:
+                timer.cancel()
+            prefetch = self._prefetches.pop(session_id, None)
+
+        excerpts = None
+        if prefetch is not None and self.is_close(prefetch.text, text):
+            try:
+                waited = time.perf_counter()
+                excerpts = prefetch.future.result()
+                waited = time.perf_counter() - waited
+                metrics.observe("prefetch_saved_seconds", max(0.0, (prefetch.duration or 0.0) - waited))
+            except Exception:
+                excerpts = None
+
+        metrics.incr("prefetch_hits" if excerpts is not None else "prefetch_misses")
+        hits, misses = metrics.counter("prefetch_hits"), metrics.counter("prefetch_misses")
+        metrics.gauge("prefetch_hit_rate", hits / (hits + misses))
+        return excerpts
+
+    def invalidate(self, *_):
+        """Forget all prefetched results, e.g. after the index was swapped."""
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._prefetches.clear()
@@ -0,0 +1,275 @@
+"""
+Hot-reloadable resume index.
+
+``ResumeIndex`` owns the retriever used by ``semantic_search``. Calling
+``reload()`` re-chunks the resume, embeds only chunks it has not seen before
+(embeddings are cached by content hash) and atomically swaps in a retriever
+over a fresh Chroma collection. Requests already holding the previous
+retriever finish against it; the retired collection is dropped
+``RETIRE_GRACE_SECONDS`` after the swap. ``PublicationIndex`` does the same for ``data/publications.json``.
+``FileWatcher`` polls file modification times and triggers
+reloads without restarting the process.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from langchain_core.embeddings import Embeddings
+
+from metrics import metrics
+from utils import build_retriever, load_publications, load_text_data, publication_document, resume_sections
+
+logger = logging.getLogger(__name__)
+
+# How long a swapped-out collection stays queryable for requests that grabbed its retriever
+RETIRE_GRACE_SECONDS = 30.0
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embedding wrapper that remembers document vectors by content hash, so
+    re-indexing only sends new or changed chunks to the underlying model.
+    """
+
+    def __init__(self, embedding_model):
+        self.embedding_model = embedding_model
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.last_embedded = 0
+        self.last_reused = 0
+
+    def embed_documents(self, texts):
+        keys = [content_hash(text) for text in texts]
+        with self._lock:
+            missing = list({key: text for key, text in zip(keys, texts) if key not in self._cache}.items())
+        if missing:
+            vectors = self.embedding_model.embed_documents([text for _, text in missing])
+            with self._lock:
+                for (key, _), vector in zip(missing, vectors):
+                    self._cache[key] = vector
+        self.last_embedded = len(missing)
+        self.last_reused = len(texts) - len(missing)
+        with self._lock:
+            return [self._cache[key] for key in keys]
+
+    def embed_query(self, text):
+        return self.embedding_model.embed_query(text)
+
+    def embed_queries(self, texts):
+        """Embed a batch of queries in one call, bypassing the document cache."""
+        return self.embedding_model.embed_documents(list(texts))
+
+    def memory_bytes(self):
+        """Approximate memory held by cached vectors (float32 equivalent)."""
+        with self._lock:
+            return sum(4 * len(vector) for vector in self._cache.values())
+
+    def retain(self, texts):
+        """Drop cached vectors for chunks that are no longer indexed."""
+        keep = {content_hash(text) for text in texts}
+        with self._lock:
+            for key in list(self._cache):
+                if key not in keep:
+                    del self._cache[key]
+
+
+class ResumeIndex:
+    """
+    Resume retriever that can be rebuilt and swapped while serving.
+    Args:
+        embedding_model: Shared embedding model.
+        path (str): Path to the resume text file.
+        k (int): Number of chunks returned per query.
+        name (str): Prefix for the Chroma collections backing this index.
+    """
+
+    def __init__(self, embedding_model, path, k=5, name="resume"):
+        self.path = path
+        self.k = k
+        self.name = name
+        self.embeddings = CachedEmbeddings(embedding_model)
+        self.generation = 0
+        self._fingerprint = None
+        self._retriever = None
+        self._retired = {}
+        self._texts = []
+        self._listeners = []
+        self._reload_lock = threading.Lock()
+        self.reload()
+
+    @property
+    def retriever(self):
+        """The current retriever; grab it once per request and keep using it."""
+        return self._retriever
+
+    def add_listener(self, callback):
+        """Register ``callback(index)`` to run after every swap, e.g. to invalidate caches."""
+        self._listeners.append(callback)
+
+    def build_chunks(self):
+        """Return (texts, metadatas) for the current contents of the resume."""
+        sections = resume_sections(load_text_data(self.path))
+        return [body for _, body in sections], [{"section": title} for title, _ in sections]
+
+    def reload(self, force=False):
+        """
+        Rebuild the index if the resume changed.
+        Args:
+            force (bool): Rebuild even if the chunk contents are unchanged.
+        Returns:
+            swapped (bool): True if a new retriever was swapped in.
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            texts, metadatas = self.build_chunks()
+            fingerprint = content_hash("\0".join(texts))
+            if fingerprint == self._fingerprint and not force:
+                return False
+
+            generation = self.generation + 1
+            retriever = build_retriever(
+                self.embeddings,
+                texts,
+                k=self.k,
+                metadatas=metadatas,
+                collection_name=f"{self.name}-{generation}",
+            )
+            self.embeddings.retain(texts)
+
+            # Swap: a single reference assignment, so readers always see a complete index
+            previous, self._retriever = self._retriever, retriever
+            self._fingerprint = fingerprint
+            self._texts = texts
+            self.generation = generation
+            if previous is not None:
+                self._retire(previous)
+
+            duration = time.perf_counter() - start
+            metrics.observe("reindex_seconds", duration)
+            metrics.incr("reindex_swaps")
+            metrics.incr("reindex_embedded_chunks", self.embeddings.last_embedded)
+            metrics.gauge(f"{self.name}_index_generation", generation)
+            logger.info(
+                "Swapped %s index to generation %d in %.0f ms (%d chunks embedded, %d reused)",
+                self.name, generation, duration * 1000, self.embeddings.last_embedded, self.embeddings.last_reused,
+            )
+
+        for callback in self._listeners:
+            try:
+                callback(self)
+            except Exception:
+                logger.exception("Index swap listener failed")
+        return True
+
+    def _retire(self, retriever):
+        """Drop ``retriever``'s collection after the grace period. Caller holds the reload lock."""
+        timer = threading.Timer(RETIRE_GRACE_SECONDS, self._drop_retired, args=(id(retriever),))
+        timer.daemon = True
+        self._retired[id(retriever)] = (retriever, timer)
+        timer.start()
+
+    def _drop_retired(self, key):
+        with self._reload_lock:
+            retired = self._retired.pop(key, None)
+        if retired is None:
+            return
+        try:
+            retired[0].vectorstore.delete_collection()
+        except Exception:
+            logger.exception("Dropping retired %s collection failed", self.name)
+
+    def memory_bytes(self):
+        """
+        Approximate memory held by this index: each vector is stored in the
+        embedding cache and in Chroma, plus the chunk texts.
+        """
+        return 2 * self.embeddings.memory_bytes() + sum(len(text.encode("utf-8")) for text in self._texts)
+
+    def close(self):
+        """Drop the Chroma collections backing this index."""
+        with self._reload_lock:
+            retrievers = [retriever for retriever, _ in self._retired.values()]
+            for _, timer in self._retired.values():
+                timer.cancel()
+            if self._retriever is not None:
+                retrievers.append(self._retriever)
+            for retriever in retrievers:
+                retriever.vectorstore.delete_collection()
+            self._retired = {}
+            self._retriever = None
+
+
+class PublicationIndex(ResumeIndex):
+    """
+    Index over the publications/projects data file, one document per entry,
+    so only the entries relevant to a question are added to the prompt.
+    """
+
+    def __init__(self, embedding_model, path, k=3, name="publications"):
+        super().__init__(embedding_model, path, k=k, name=name)
+
+    def build_chunks(self):
+        publications = load_publications(self.path)
+        texts = [publication_document(publication) for publication in publications]
+        metadatas = [
+            {
+                "title": publication["title"],
+                "link": publication.get("link") or "",
+                "type": publication.get("type") or "",
+                "position": position,
+            }
+            for position, publication in enumerate(publications)
+        ]
+        return texts, metadatas
+
+
+class FileWatcher(threading.Thread):
+    """
+    Poll files for modification-time changes and run their callbacks.
+    Args:
+        interval (float): Seconds between polls.
+    """
+
+    def __init__(self, interval=2.0):
+        super().__init__(daemon=True, name="resume-file-watcher")
+        self.interval = interval
+        self._watches = {}
+        self._stop_event = threading.Event()
+
+    def watch(self, path, callback):
+        """Call ``callback()`` whenever ``path`` changes (including creation or deletion)."""
+        self._watches[path] = [self._mtime(path), callback]
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def poll(self):
+        """Check every watched file once."""
+        for path, watch in list(self._watches.items()):
+            mtime = self._mtime(path)
+            if mtime == watch[0]:
+                continue
+            watch[0] = mtime
+            logger.info("Detected change in %s", path)
+            try:
+                watch[1]()
+            except Exception:
+                logger.exception("Reload after change to %s failed", path)
+                metrics.incr("reindex_failures")
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def stop(self):
+        self._stop_event.set()
@@ -0,0 +1,284 @@
+"""
+Batch job-description scoring against the resume.
+
+Scores many job descriptions at once for bulk screening: JDs are embedded in
+batches with the same embedding model as the app, compared against every
+resume section with one matrix product, and written out as they are scored.
+Optionally, the top-N matches get a written analysis from the LLM, with
+bounded concurrency. Re-running with the same output file resumes where the
+previous run stopped.
+
+Usage:
+    python score_jds.py jds/ -o scores.jsonl
+    python score_jds.py jds.jsonl -o scores.csv --llm-top 20 --llm-concurrency 4
+
+Input is either a directory of .txt/.md files (the file name is the JD id) or
+a JSONL file with "id" and "text" (or "job_description") fields.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from utils import (
+    JD_MATCH_PREFIX,
+    load_text_data,
+    resume_chat_completion,
+    resume_sections,
+    setup_embedding_model,
+)
+
+CSV_FIELDS = ["id", "score", "best_similarity", "top_sections"]
+
+
+def read_job_descriptions(source):
+    """
+    Yield (jd_id, text) pairs from a directory of text files or a JSONL file.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith((".txt", ".md")):
+                yield os.path.splitext(name)[0], load_text_data(os.path.join(source, name))
+        return
+    with open(source, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            text = record.get("text") or record.get("job_description") or ""
+            yield str(record.get("id", line_number)), text
+
+
+def read_done_ids(path):
+    """Ids already present in an output file, so an interrupted run can resume."""
+    if not os.path.exists(path):
+        return set()
+    done = set()
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(file):
+                if row.get("id") and row.get("score"):
+                    done.add(row["id"])
+        else:
+            for line in file:
+                try:
+                    done.add(str(json.loads(line)["id"]))
+                except (ValueError, KeyError):
+                    # Partially written last line from a crash
+                    continue
+    return done
+
+
+def read_scores(path):
+    """All scored rows from an output file, as dicts with id, score and top_sections."""
+    rows = []
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(file):
+                if row.get("score"):
+                    rows.append(
+                        {"id": row["id"], "score": float(row["score"]), "top_sections": row["top_sections"].split(";")}
+                    )
+        else:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    rows.append(
+                        {"id": str(record["id"]), "score": float(record["score"]), "top_sections": record["top_sections"]}
+                    )
+                except (ValueError, KeyError):
+                    continue
+    return rows
+
+
+def truncate_partial_line(path):
+    """Cut a partially written last line (from a crash) off the end of ``path``."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r+b") as file:
+        size = file.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        file.seek(size - 1)
+        if file.read(1) == b"\n":
+            return
+        # Walk back in blocks to the last newline; no newline means the whole file is partial
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            file.seek(start)
+            newline = file.read(end - start).rfind(b"\n")
+            if newline != -1:
+                file.truncate(start + newline + 1)
+                return
+            end = start
+        file.truncate(0)
+
+
+class ResultWriter:
+    """Append-only JSONL/CSV writer that flushes after every batch."""
+
+    def __init__(self, path):
+        self.is_csv = path.endswith(".csv")
+        # Appending after a partial line would glue the next record onto it
+        truncate_partial_line(path)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", encoding="utf-8", newline="")
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDS)
+            if new_file:
+                self.writer.writeheader()
+
+    def write(self, record):
+        if self.is_csv:
+            self.writer.writerow({**record, "top_sections": ";".join(record["top_sections"])})
+        else:
+            self.file.write(json.dumps(record) + "\n")
+
+    def flush(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+def normalise(matrix):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    return matrix / np.clip(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12, None)
+
+
+def score_batch(jd_vectors, section_vectors, section_titles, top_k):
+    """
+    Score a batch of JDs against all resume sections in one matrix product.
+    Returns:
+        (scores, best, top_indices): Mean of the top_k section similarities,
+            the best single similarity, and the top section indices per JD.
+    """
+    similarities = normalise(jd_vectors) @ section_vectors.T
+    top_k = min(top_k, len(section_titles))
+    top_indices = np.argsort(-similarities, axis=1)[:, :top_k]
+    top_values = np.take_along_axis(similarities, top_indices, axis=1)
+    return top_values.mean(axis=1), top_values[:, 0], top_indices
+
+
+def batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def run_llm_analysis(args, sections, jd_texts, ranked):
+    """
+    Ask the LLM for a match analysis of the top JDs, with bounded concurrency.
+    Each JD is sent with only the resume sections it scored highest against.
+    """
+    from dotenv import load_dotenv
+    from groq import Groq
+
+    load_dotenv()
+    client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    done = read_done_ids(args.llm_output)
+    todo = [row for row in ranked if row["id"] not in done]
+    section_text = dict(sections)
+
+    def analyse(row):
+        jd_id = row["id"]
+        excerpts = "".join(section_text[title] + "\n\n" for title in row["top_sections"] if title in section_text)
+        try:
+            answer = resume_chat_completion(client, args.llm_model, JD_MATCH_PREFIX + jd_texts[jd_id], excerpts)
+            return {"id": jd_id, "score": row["score"], "analysis": answer}
+        except Exception as e:
+            return {"id": jd_id, "error": str(e)}
+
+    writer = ResultWriter(args.llm_output)
+    try:
+        with ThreadPoolExecutor(max_workers=args.llm_concurrency) as pool:
+            for record in pool.map(analyse, todo):
+                # Failed calls are left out so a re-run retries them
+                if "analysis" in record:
+                    writer.write(record)
+                    writer.flush()
+                else:
+                    print(f"LLM analysis failed for {record['id']}: {record['error']}", file=sys.stderr)
+    finally:
+        writer.close()
+    print(f"LLM analysis written for {len(todo)} job descriptions to {args.llm_output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score job descriptions against the resume in bulk.")
+    parser.add_argument("source", help="Directory of .txt/.md files or a JSONL file of job descriptions.")
+    parser.add_argument("-o", "--output", default="jd_scores.jsonl", help="Output .jsonl or .csv (also the checkpoint).")
+    parser.add_argument("--resume", default="data/resume.txt", help="Resume text file.")
+    parser.add_argument("--model", default="sentence-transformers/all-mpnet-base-v2")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--top-k", type=int, default=3, help="Resume sections averaged into the score.")
+    parser.add_argument("--llm-top", type=int, default=0, help="Run an LLM match analysis for the N best JDs.")
+    parser.add_argument("--llm-concurrency", type=int, default=4)
+    parser.add_argument("--llm-model", default="llama-3.3-70b-versatile")
+    parser.add_argument("--llm-output", help="Where to write LLM analyses (default: <output>.analysis.jsonl).")
+    args = parser.parse_args()
+    args.llm_output = args.llm_output or os.path.splitext(args.output)[0] + ".analysis.jsonl"
+
+    embedding_model = setup_embedding_model(model_name=args.model)
+    sections = resume_sections(load_text_data(args.resume))
+    section_titles = [title for title, _ in sections]
+    section_vectors = normalise(embedding_model.embed_documents([body for _, body in sections]))
+
+    done = read_done_ids(args.output)
+    jd_texts = {}
+    pending = []
+    for jd_id, text in read_job_descriptions(args.source):
+        if args.llm_top:
+            jd_texts[jd_id] = text
+        if jd_id not in done and text.strip():
+            pending.append((jd_id, text))
+    if done:
+        print(f"Resuming: {len(done)} already scored, {len(pending)} to go")
+
+    writer = ResultWriter(args.output)
+    scored = 0
+    start = time.perf_counter()
+    try:
+        for batch in batched(pending, args.batch_size):
+            vectors = embedding_model.embed_documents([text for _, text in batch])
+            scores, best, top_indices = score_batch(vectors, section_vectors, section_titles, args.top_k)
+            for (jd_id, _), score, best_similarity, indices in zip(batch, scores, best, top_indices):
+                writer.write(
+                    {
+                        "id": jd_id,
+                        "score": round(float(score), 4),
+                        "best_similarity": round(float(best_similarity), 4),
+                        "top_sections": [section_titles[i] for i in indices],
+                    }
+                )
+            writer.flush()
+            scored += len(batch)
+            elapsed = time.perf_counter() - start
+            print(f"{scored}/{len(pending)} scored, {scored / elapsed:.1f} JDs/s", file=sys.stderr)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    rate = scored / elapsed if elapsed and scored else 0.0
+    print(f"Scored {scored} job descriptions in {elapsed:.1f} s ({rate:.1f} JDs/s) -> {args.output}")
+
+    if args.llm_top:
+        ranked = sorted(read_scores(args.output), key=lambda row: row["score"], reverse=True)
+        ranked = [row for row in ranked if row["id"] in jd_texts][: args.llm_top]
+        run_llm_analysis(args, sections, jd_texts, ranked)
+
+
+if __name__ == "__main__":
+    main()
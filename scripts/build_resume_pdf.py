@@ -0,0 +1,179 @@
+"""
+Regenerate data/resume.pdf from data/resume.txt so the downloadable resume
+never drifts from the text Ressy answers from. Run at build time:
+
+    python scripts/build_resume_pdf.py            # write data/resume.pdf
+    python scripts/build_resume_pdf.py --check    # exit 1 if the PDF is stale
+
+The PDF uses the standard Helvetica fonts (nothing to embed) and records the
+SHA-256 of the source text in its metadata, which is what --check compares.
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import zlib
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+MARGIN = 56
+BODY_SIZE, HEADING_SIZE, TITLE_SIZE = 10, 12, 18
+LEADING = 1.35
+# Average Helvetica glyph width as a fraction of the font size, for wrapping
+AVERAGE_CHAR_WIDTH = 0.5
+SOURCE_HASH_PATTERN = re.compile(rb"/Subject \(source-sha256:([0-9a-f]{64})\)")
+
+
+def pdf_string(text):
+    """Encode text as a PDF literal string in WinAnsiEncoding."""
+    data = text.encode("cp1252", errors="replace")
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def wrap(text, size):
+    width = int((PAGE_WIDTH - 2 * MARGIN) / (size * AVERAGE_CHAR_WIDTH))
+    words, lines, line = text.split(), [], ""
+    for word in words:
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    lines.append(line)
+    return lines
+
+
+def layout(text):
+    """
+    Turn resume text into (font, size, line) entries; None marks a section rule.
+    Sections are separated by "---"; a section's all-caps first line is a heading.
+    """
+    entries = []
+    for index, section in enumerate(part.strip() for part in text.split("---")):
+        if not section:
+            continue
+        if entries:
+            entries.append(None)
+        for line_number, raw in enumerate(section.splitlines()):
+            line = raw.strip().strip("=").strip()
+            if not line:
+                entries.append(("F1", BODY_SIZE, ""))
+            elif index == 0 and line_number == 0:
+                entries.append(("F2", TITLE_SIZE, line))
+            elif line_number == 0 and line.isupper():
+                entries.append(("F2", HEADING_SIZE, line))
+            else:
+                for piece in wrap(re.sub(r"\s{2,}", "   ", line), BODY_SIZE):
+                    entries.append(("F1", BODY_SIZE, piece))
+    return entries
+
+
+def paginate(entries):
+    """Render entries into one content stream per page."""
+    pages, ops = [], []
+    y = PAGE_HEIGHT - MARGIN
+    for entry in entries:
+        step = (BODY_SIZE if entry is None else entry[1]) * LEADING
+        if y - step < MARGIN:
+            pages.append(b"\n".join(ops))
+            ops, y = [], PAGE_HEIGHT - MARGIN
+        y -= step
+        if entry is None:
+            rule_y = y + step / 2
+            ops.append(f"0.6 G 0.5 w {MARGIN} {rule_y:.1f} m {PAGE_WIDTH - MARGIN} {rule_y:.1f} l S".encode())
+            continue
+        font, size, line = entry
+        if line:
+            ops.append(f"BT /{font} {size} Tf {MARGIN} {y:.1f} Td ".encode() + pdf_string(line) + b" Tj ET")
+    pages.append(b"\n".join(ops))
+    return pages
+
+
+def render_pdf(text, title="Resume"):
+    """
+    Render resume text to PDF bytes.
+    Args:
+        text (str): Resume text, sections separated by "---".
+        title (str): Document title metadata.
+    Returns:
+        pdf (bytes): The PDF document.
+    """
+    pages = paginate(layout(text))
+    source_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    # Object numbers: 1 catalog, 2 pages, 3-4 fonts, 5 info, then (page, content) pairs
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        4: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        5: b"<< /Title " + pdf_string(title) + b" /Subject (source-sha256:" + source_hash.encode() + b")"
+        + b" /Producer (build_resume_pdf.py) >>",
+    }
+    kids = []
+    for i, content in enumerate(pages):
+        page_number, content_number = 6 + 2 * i, 7 + 2 * i
+        kids.append(f"{page_number} 0 R".encode())
+        objects[page_number] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}]"
+            f" /Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {content_number} 0 R >>"
+        ).encode()
+        stream = zlib.compress(content, 9)
+        objects[content_number] = (
+            f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+    objects[2] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + f"] /Count {len(pages)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(output)
+        output += f"{number} 0 obj\n".encode() + objects[number] + b"\nendobj\n"
+    xref = len(output)
+    count = max(objects) + 1
+    output += f"xref\n0 {count}\n0000000000 65535 f \n".encode()
+    for number in range(1, count):
+        output += f"{offsets[number]:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {count} /Root 1 0 R /Info 5 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(output)
+
+
+def is_current(pdf_path, text):
+    """True if the PDF at pdf_path was generated from exactly this text."""
+    try:
+        with open(pdf_path, "rb") as file:
+            match = SOURCE_HASH_PATTERN.search(file.read())
+    except FileNotFoundError:
+        return False
+    return bool(match) and match.group(1).decode() == hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the resume PDF from the resume text.")
+    parser.add_argument("--source", default=os.path.join(REPO_ROOT, "data", "resume.txt"))
+    parser.add_argument("--output", default=os.path.join(REPO_ROOT, "data", "resume.pdf"))
+    parser.add_argument("--check", action="store_true", help="Only check the PDF matches the text.")
+    args = parser.parse_args()
+
+    with open(args.source, "r", encoding="utf-8") as file:
+        text = file.read()
+    if args.check:
+        if not is_current(args.output, text):
+            print(f"{args.output} is out of date with {args.source}; run scripts/build_resume_pdf.py")
+            sys.exit(1)
+        print(f"{args.output} is up to date")
+        return
+
+    title = text.strip().splitlines()[0].strip() if text.strip() else "Resume"
+    pdf = render_pdf(text, title=f"{title} - Resume")
+    # Write then rename, so the running app never serves a half-written file
+    temporary = args.output + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(pdf)
+    os.replace(temporary, args.output)
+    print(f"Wrote {args.output} ({len(pdf)} bytes, {pdf.count(b'/Type /Page ')} pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Download the third-party front-end assets into static/vendor/ so the app can
+serve them itself (with long-lived cache headers) instead of hot-linking
+unpkg and lottie.host. Run it as a build step; the app never downloads them
+itself and serves the page without any that are missing:
+
+    python scripts/fetch_assets.py          # download all vendor assets
+    python scripts/fetch_assets.py --check  # exit non-zero if any are missing
+"""
+import argparse
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from static_assets import STATIC_DIR, VENDOR_ASSETS, fetch_vendor_assets, missing_vendor_assets  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download vendor front-end assets into static/vendor/.")
+    parser.add_argument("--check", action="store_true", help="Only check that every asset is present.")
+    args = parser.parse_args()
+
+    root = os.path.join(REPO_ROOT, STATIC_DIR)
+    if args.check:
+        missing = missing_vendor_assets(root)
+        for name in missing:
+            print(f"missing: {STATIC_DIR}/{name}")
+        sys.exit(1 if missing else 0)
+
+    for name, size in fetch_vendor_assets(root):
+        print(f"{VENDOR_ASSETS[name]} -> {STATIC_DIR}/{name} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Server-side chat session store.
+
+Chat history lives on the server, keyed by session ID, so the UI only has to send the new message each turn instead of
+round-tripping the whole conversation. Sessions are kept in memory with LRU
+and idle-TTL eviction; when a SQLite path is given, history is also written
+through to disk and reloaded on a cache miss (e.g. after eviction or a
+restart). Expired sessions are pruned from memory and disk every
+``prune_interval`` seconds as messages are appended.
+"""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class Session:
+    def __init__(self, history=None):
+        self.history = history or []
+        self.last_seen = time.monotonic()
+
+
+class SessionStore:
+    """
+    LRU/TTL session store with optional SQLite write-through.
+    Args:
+        max_sessions (int): Sessions kept in memory before LRU eviction.
+        ttl (float): Seconds of inactivity after which a session expires.
+        db_path (str): Optional SQLite file for persisting history.
+        prune_interval (float): Minimum seconds between prunes triggered by ``append``.
+    """
+
+    def __init__(self, max_sessions=1000, ttl=3600.0, db_path=None, prune_interval=300.0):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.prune_interval = prune_interval
+        self._last_prune = time.monotonic()
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                " session_id TEXT NOT NULL, seq INTEGER NOT NULL, role TEXT NOT NULL,"
+                " content TEXT NOT NULL, created REAL NOT NULL, PRIMARY KEY (session_id, seq))"
+            )
+            self._db.commit()
+
+    def _load(self, session_id):
+        if self._db is None:
+            return []
+        rows = self._db.execute(
+            "SELECT role, content, created FROM messages WHERE session_id = ? ORDER BY seq", (session_id,)
+        ).fetchall()
+        if rows and time.time() - rows[-1][2] > self.ttl:
+            # Expired: the new history restarts at seq 1, so stale rows must not survive to mix in
+            self._delete(session_id)
+            return []
+        return [{"role": role, "content": content} for role, content, _ in rows]
+
+    def _delete(self, session_id):
+        """Drop a session's persisted history. Caller holds the lock."""
+        if self._db is not None:
+            self._db.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._db.commit()
+
+    def _session(self, session_id):
+        """Return the live session, loading or creating it. Caller holds the lock."""
+        now = time.monotonic()
+        session = self._sessions.get(session_id)
+        if session is not None and now - session.last_seen > self.ttl:
+            del self._sessions[session_id]
+            self._delete(session_id)
+            session = None
+        if session is None:
+            session = self._sessions[session_id] = Session(self._load(session_id))
+        self._sessions.move_to_end(session_id)
+        session.last_seen = now
+        self._evict(now)
+        return session
+
+    def _evict(self, now):
+        while self._sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+            if len(self._sessions) > self.max_sessions or now - oldest.last_seen > self.ttl:
+                del self._sessions[oldest_id]
+            else:
+                break
+
+    def history(self, session_id):
+        """Return a copy of the session's chat history (Gradio "messages" format)."""
+        with self._lock:
+            return list(self._session(session_id).history)
+
+    def append(self, session_id, role, content):
+        """Append one message to the session's history."""
+        with self._lock:
+            session = self._session(session_id)
+            session.history.append({"role": role, "content": content})
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?)",
+                    (session_id, len(session.history), role, content, time.time()),
+                )
+                self._db.commit()
+            if time.monotonic() - self._last_prune >= self.prune_interval:
+                self._prune()
+
+    def prune(self):
+        """Drop expired sessions from memory and expired history from SQLite."""
+        with self._lock:
+            self._prune()
+
+    def _prune(self):
+        """Caller holds the lock."""
+        now = time.monotonic()
+        self._last_prune = now
+        self._evict(now)
+        if self._db is not None:
+            # Whole sessions only: early messages of a session that is still active must stay
+            self._db.execute(
+                "DELETE FROM messages WHERE session_id IN"
+                " (SELECT session_id FROM messages GROUP BY session_id HAVING MAX(created) <= ?)",
+                (time.time() - self.ttl,),
+            )
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
@@ -0,0 +1,186 @@
+/*
+ * Ressy page behaviour: info and contact modals, contact status feedback,
+ * intro prompt cards and chat autoscroll.
+ * Loaded once from <head> with defer, so it may run before or after Gradio
+ * renders the app. It initialises itself: each piece is bound as soon as its
+ * elements exist, with a temporary document observer until everything is
+ * bound. Ressy.init() (also called from Blocks js=) is safe to call repeatedly.
+ * Once bound, the only DOM watching is one MutationObserver scoped to the chatbot.
+ */
+(function () {
+    const assets = window.RESSY_ASSETS || {};
+    const bound = {};
+    let readyObserver = null;
+    let playerRequested = false;
+
+    function loadLottiePlayer() {
+        if (playerRequested || !assets.lottiePlayer || customElements.get("dotlottie-player")) return;
+        playerRequested = true;
+        const script = document.createElement("script");
+        script.type = "module";
+        script.src = assets.lottiePlayer;
+        document.head.appendChild(script);
+    }
+
+    function showSuccessAnimation() {
+        const modal = document.getElementById("success_animation_modal");
+        const gradioModalRoot = document.getElementById("suggestion_section_gradio");
+        if (gradioModalRoot) gradioModalRoot.style.display = "none";
+        if (!modal) return;
+
+        // The success animation is only fetched the first time a message is sent, if it is self-hosted
+        const animation = assets.lottiePlayer && assets.successAnimation;
+        if (animation) loadLottiePlayer();
+        modal.innerHTML = `
+            ${animation ? `<dotlottie-player
+                src="${assets.successAnimation}"
+                background="transparent"
+                speed="1"
+                style="width: 150px; height: 150px; margin: 0 auto;"
+                autoplay>
+            </dotlottie-player>` : ""}
+            <p style="margin-top: 15px; font-size: 1.2em;">Message sent successfully! 🎉</p>
+        `;
+        modal.style.display = "block";
+        setTimeout(() => {
+            modal.style.display = "none";
+        }, 3000);
+    }
+
+    // Called by the contact form's submit event with the status returned by Python
+    function onContactStatus(status) {
+        if (!status) return;
+        const modalMessageDisplay = document.getElementById("modal_message_display");
+        if (status === "SUCCESS") {
+            showSuccessAnimation();
+        } else if (status.startsWith("ERROR:") && modalMessageDisplay) {
+            modalMessageDisplay.style.color = "#ff6b6b";
+            modalMessageDisplay.textContent = status.replace("ERROR:", "❌");
+        }
+    }
+
+    function fillPromptAndSubmit(text) {
+        const textbox = document.querySelector("#input_textbox textarea");
+        if (!textbox) return;
+        textbox.value = text;
+        textbox.dispatchEvent(new Event("input", { bubbles: true }));
+        const submitButton = document.querySelector("#send_button");
+        if (submitButton) {
+            submitButton.click();
+        }
+    }
+
+    function clearAndHideIntro() {
+        const textbox = document.querySelector("#input_textbox textarea");
+        if (textbox) textbox.value = "";
+        const intro = document.querySelector("#intro_container");
+        const chatbot = document.querySelector("#chatbot");
+        if (intro) intro.style.display = "none";
+        if (chatbot) chatbot.style.display = "block";
+    }
+
+    function watchChat() {
+        const chatbot = document.getElementById("chatbot");
+        if (!chatbot) return false;
+        let scrollQueued = false;
+
+        // Coalesce bursts of chat updates into one scroll per frame
+        const observer = new MutationObserver(() => {
+            if (scrollQueued) return;
+            scrollQueued = true;
+            requestAnimationFrame(() => {
+                scrollQueued = false;
+                chatbot.scrollTo({ top: chatbot.scrollHeight, behavior: "smooth" });
+            });
+        });
+        observer.observe(chatbot, { childList: true, subtree: true });
+        return true;
+    }
+
+    // Info Modal Logic
+    function bindInfoModal() {
+        const infoIcon = document.getElementById("info_icon");
+        const infoModal = document.getElementById("info_modal");
+        const closeInfoModal = document.getElementById("close_info_modal");
+        if (!infoIcon || !infoModal || !closeInfoModal) return false;
+        infoIcon.onclick = () => {
+            infoModal.style.display = "block";
+        };
+        closeInfoModal.onclick = () => {
+            infoModal.style.display = "none";
+        };
+        return true;
+    }
+
+    // SUGGESTION (Connect with me) BUTTON BRIDGE
+    function bindContactBridge() {
+        const htmlSuggestIcon = document.getElementById("suggest_icon");
+        const gradioSuggestTrigger = document.getElementById("suggest_trigger_btn_id");
+        if (!htmlSuggestIcon || !gradioSuggestTrigger) return false;
+        htmlSuggestIcon.onclick = () => {
+            gradioSuggestTrigger.click(); // Programmatically click the hidden Gradio button
+            const modalMessageDisplay = document.getElementById("modal_message_display");
+            if (modalMessageDisplay) modalMessageDisplay.textContent = "";
+            const suggestionInput = document.querySelector("#suggestion_section_gradio textarea");
+            if (suggestionInput) suggestionInput.value = "";
+        };
+        return true;
+    }
+
+    // Hide the intro as soon as a message is sent
+    function bindInput() {
+        const textbox = document.querySelector("#input_textbox textarea");
+        const button = document.querySelector("#send_button");
+        if (!textbox || !button) return false;
+        button.addEventListener("click", clearAndHideIntro);
+        textbox.addEventListener("keydown", (e) => {
+            if (e.key === "Enter" && !e.shiftKey) {
+                setTimeout(clearAndHideIntro, 10);
+            }
+        });
+        return true;
+    }
+
+    const binders = { info: bindInfoModal, contact: bindContactBridge, input: bindInput, chat: watchChat };
+
+    // Bind whatever is not bound yet; returns true once everything is. Safe to call repeatedly.
+    function init() {
+        for (const [name, bind] of Object.entries(binders)) {
+            if (!bound[name] && bind()) bound[name] = true;
+        }
+        const done = Object.keys(binders).every((name) => bound[name]);
+        if (done && readyObserver) {
+            readyObserver.disconnect();
+            readyObserver = null;
+        }
+        if (done && !bound.marked) {
+            bound.marked = true;
+            if (window.performance && performance.mark) performance.mark("ressy-interactive");
+        }
+        return done;
+    }
+
+    // Until the app root has rendered, retry on DOM changes (at most once per frame)
+    function initWhenReady() {
+        if (init() || readyObserver) return;
+        let queued = false;
+        readyObserver = new MutationObserver(() => {
+            if (queued) return;
+            queued = true;
+            requestAnimationFrame(() => {
+                queued = false;
+                init();
+            });
+        });
+        readyObserver.observe(document.documentElement, { childList: true, subtree: true });
+    }
+
+    window.Ressy = { init, onContactStatus };
+    window.fillPromptAndSubmit = fillPromptAndSubmit;
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", initWhenReady);
+    } else {
+        initWhenReady();
+    }
+})();
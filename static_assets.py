@@ -0,0 +1,274 @@
+"""
+Static asset serving for the page and the resume PDF.
+
+Assets are read once, gzip-compressed once when worthwhile, and served with
+strong ETags, Last-Modified and single-range (``Range: bytes=``) support.
+URLs produced by ``AssetStore.url`` carry a content-hash ``v=`` parameter,
+so those responses can be cached by browsers for a year (``immutable``); a
+changed file gets a new URL. Single-file routes (``create_file_router``) are
+always served with a short, revalidated cache instead.
+"""
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import threading
+import urllib.request
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import APIRouter, Request, Response
+
+logger = logging.getLogger(__name__)
+
+ASSET_PREFIX = "/ressy-assets"
+STATIC_DIR = "static"
+
+# Third-party assets self-hosted under static/ (see scripts/fetch_assets.py), with their upstream URLs
+VENDOR_ASSETS = {
+    "vendor/dotlottie-player.mjs": "https://unpkg.com/@dotlottie/player-component@2.7.12/dist/dotlottie-player.mjs",
+    "vendor/intro.lottie": "https://lottie.host/3a69db62-ac6b-419d-8949-79fe213690c8/QJbL66mr48.lottie",
+    "vendor/success.lottie": "https://lottie.host/805186b5-0c2d-450a-9d6c-6743b2f518e3/a87e5b1q7o.lottie",
+}
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/pdf")
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+LONG_CACHE = "public, max-age=31536000, immutable"
+SHORT_CACHE = "public, max-age=300, must-revalidate"
+
+mimetypes.add_type("application/javascript", ".mjs")
+mimetypes.add_type("application/zip", ".lottie")
+
+
+class Asset:
+    def __init__(self, path, body, mtime):
+        self.path = path
+        self.body = body
+        self.mtime = mtime
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.last_modified = formatdate(mtime, usegmt=True)
+        self.media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self.gzip_body = None
+        if self.media_type.startswith(COMPRESSIBLE_TYPES) and len(body) > 512:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+
+
+class AssetStore:
+    """
+    In-memory cache of files under ``root``, refreshed when a file's mtime changes.
+    Args:
+        root (str): Directory holding the assets.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._assets = {}
+        self._lock = threading.Lock()
+
+    def path(self, name):
+        """Absolute path of ``name`` if it stays inside the root, else None."""
+        path = os.path.abspath(os.path.join(self.root, name))
+        if not path.startswith(self.root + os.sep):
+            return None
+        return path
+
+    def get(self, name):
+        """Return the Asset for ``name``, or None if it does not exist."""
+        path = self.path(name)
+        if path is None:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        with self._lock:
+            asset = self._assets.get(name)
+            if asset is not None and asset.mtime == mtime:
+                return asset
+        with open(path, "rb") as file:
+            asset = Asset(path, file.read(), mtime)
+        with self._lock:
+            self._assets[name] = asset
+        return asset
+
+    def url(self, name, route=None):
+        """
+        Versioned URL for ``name``, under ``route`` if it has a dedicated one.
+        Raises:
+            FileNotFoundError: If the asset does not exist; there is no CDN fallback.
+        """
+        asset = self.get(name)
+        if asset is None:
+            raise FileNotFoundError(f"Asset {name} not found under {self.root}")
+        return f"{route or ASSET_PREFIX + '/' + name}?v={asset.etag[:12]}"
+
+
+def missing_vendor_assets(root=STATIC_DIR):
+    """Names in VENDOR_ASSETS that are not present under ``root``."""
+    return [name for name in VENDOR_ASSETS if not os.path.isfile(os.path.join(root, name))]
+
+
+def fetch_vendor_assets(root=STATIC_DIR, names=None):
+    """
+    Download vendor assets from their upstream URLs into ``root``.
+    Args:
+        root (str): Static directory.
+        names (list): Assets to fetch; all of VENDOR_ASSETS by default.
+    Returns:
+        fetched (list): (name, size in bytes) for every downloaded asset.
+    """
+    fetched = []
+    for name in names or VENDOR_ASSETS:
+        target = os.path.join(root, name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with urllib.request.urlopen(VENDOR_ASSETS[name], timeout=30) as response:
+            body = response.read()
+        # Write then rename, so a failed download never leaves a truncated asset behind
+        with open(target + ".part", "wb") as file:
+            file.write(body)
+        os.replace(target + ".part", target)
+        fetched.append((name, len(body)))
+    return fetched
+
+
+def vendor_asset_urls(store):
+    """
+    Versioned URLs of the vendor assets present in ``store``. Missing ones are
+    left out with a warning, so the page renders without the animations
+    instead of hot-linking the CDNs; nothing is downloaded here.
+    Returns:
+        urls (dict): Asset name -> URL, for present assets only.
+    """
+    urls = {}
+    for name in VENDOR_ASSETS:
+        if store.get(name) is not None:
+            urls[name] = store.url(name)
+    missing = [name for name in VENDOR_ASSETS if name not in urls]
+    if missing:
+        logger.warning(
+            "Vendor assets %s are missing from %s/; the page is served without them. "
+            "Run `python scripts/fetch_assets.py` as a build step to self-host them.",
+            ", ".join(missing), store.root,
+        )
+    return urls
+
+
+def accepts_gzip(request):
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def not_modified(asset, request):
+    """True if the client's conditional headers match ``asset``."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return if_none_match.strip() in ("*", f'"{asset.etag}"', f'W/"{asset.etag}"')
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(asset.mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def parse_range(header, size):
+    """
+    Parse a single ``bytes=start-end`` range.
+    Returns:
+        (start, end) inclusive, None to ignore the header (multi-range or
+        malformed), or "unsatisfiable".
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    if match.group(1) == "":
+        length = int(match.group(2))
+        if length == 0:
+            return "unsatisfiable"
+        return max(0, size - length), size - 1
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else size - 1
+    if start >= size or end < start:
+        return "unsatisfiable"
+    return start, min(end, size - 1)
+
+
+def asset_response(asset, request, cache_control):
+    """
+    Build a response for ``asset`` honouring conditional requests, single byte
+    ranges and gzip negotiation. Ranges are always served from the identity
+    encoding.
+    """
+    headers = {
+        "ETag": f'"{asset.etag}"',
+        "Last-Modified": asset.last_modified,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept-Encoding",
+    }
+    if not_modified(asset, request):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() in (f'"{asset.etag}"', asset.last_modified)):
+        byte_range = parse_range(range_header, len(asset.body))
+        if byte_range == "unsatisfiable":
+            headers["Content-Range"] = f"bytes */{len(asset.body)}"
+            return Response(status_code=416, headers=headers)
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(asset.body)}"
+            return Response(
+                content=asset.body[start:end + 1], status_code=206, media_type=asset.media_type, headers=headers
+            )
+
+    body = asset.body
+    if asset.gzip_body is not None and accepts_gzip(request):
+        body = asset.gzip_body
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type=asset.media_type, headers=headers)
+
+
+def create_asset_router(store):
+    """Router serving ``store`` under ``ASSET_PREFIX``."""
+    router = APIRouter()
+
+    @router.get(ASSET_PREFIX + "/{name:path}")
+    def serve_asset(name: str, request: Request):
+        asset = store.get(name)
+        if asset is None:
+            return Response(status_code=404)
+        versioned = request.query_params.get("v") == asset.etag[:12]
+        return asset_response(asset, request, LONG_CACHE if versioned else SHORT_CACHE)
+
+    return router
+
+
+def create_file_router(store, route, name, download_name=None):
+    """
+    Router serving one file from ``store`` at ``route`` (e.g. the resume PDF),
+    outside Gradio's queue. The link to it is rendered once at startup, so
+    the file is never served as immutable: browsers revalidate it with its
+    ETag after SHORT_CACHE expires and pick up a replaced file.
+    Args:
+        store (AssetStore): Store holding the file.
+        route (str): URL path, e.g. "/resume.pdf".
+        name (str): File name within the store.
+        download_name (str): Optional file name suggested to the browser.
+    """
+    router = APIRouter()
+
+    @router.get(route)
+    def serve_file(request: Request):
+        asset = store.get(name)
+        if asset is None:
+            return Response(status_code=404)
+        response = asset_response(asset, request, SHORT_CACHE)
+        if download_name:
+            response.headers["Content-Disposition"] = f'inline; filename="{download_name}"'
+        return response
+
+    return router
@@ -0,0 +1,192 @@
+"""
+Multi-tenant profile serving.
+
+Each profile lives in its own directory under a profiles root::
+
+    profiles/<profile_id>/resume.txt          required
+    profiles/<profile_id>/publications.json   optional, same format as data/publications.json
+    profiles/<profile_id>/profile.json        optional: {"name": ..., "first_name": ..., "system_prompt": ...}
+
+Profiles are loaded lazily on first request into their own namespaced Chroma
+collections, all sharing one embedding model, and least-recently-used
+profiles are evicted once the estimated memory of the loaded indexes exceeds
+the budget.
+"""
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from metrics import metrics
+from resume_index import PublicationIndex, ResumeIndex
+from utils import SYSTEM_PROMPT_TEMPLATE
+
+logger = logging.getLogger(__name__)
+
+# Also keeps ids usable in Chroma collection names and safe as directory names
+PROFILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,31}$")
+EVICTION_GRACE_SECONDS = 30.0
+
+
+class ProfileNotFound(KeyError):
+    pass
+
+
+class Profile:
+    """
+    A loaded candidate profile: indexes plus prompt settings.
+    Args:
+        profile_id (str): Directory name of the profile.
+        directory (str): Path to the profile's directory.
+        embedding_model: Shared embedding model.
+        k (int): Resume chunks returned per query.
+        load_id (int): Distinguishes this load's Chroma collections from those of an
+            earlier, evicted load of the same profile that may not be dropped yet.
+    """
+
+    def __init__(self, profile_id, directory, embedding_model, k=5, load_id=0):
+        self.profile_id = profile_id
+        settings = {}
+        settings_path = os.path.join(directory, "profile.json")
+        if os.path.exists(settings_path):
+            with open(settings_path, "r", encoding="utf-8") as file:
+                settings = json.load(file)
+        self.name = settings.get("name", profile_id)
+        self.first_name = settings.get("first_name", self.name.split()[0])
+        self.system_prompt = settings.get("system_prompt") or SYSTEM_PROMPT_TEMPLATE.format(
+            name=self.name, first_name=self.first_name
+        )
+
+        self.resume_index = ResumeIndex(
+            embedding_model, os.path.join(directory, "resume.txt"), k=k, name=f"p-{profile_id}-{load_id}-resume"
+        )
+        publications_path = os.path.join(directory, "publications.json")
+        self.publication_index = None
+        if os.path.exists(publications_path):
+            self.publication_index = PublicationIndex(
+                embedding_model, publications_path, name=f"p-{profile_id}-{load_id}-pubs"
+            )
+
+    def indexes(self):
+        return [index for index in (self.resume_index, self.publication_index) if index is not None]
+
+    def memory_bytes(self):
+        return sum(index.memory_bytes() for index in self.indexes())
+
+    def close(self):
+        for index in self.indexes():
+            index.close()
+
+
+class ProfileRegistry:
+    """
+    Lazily loaded, LRU-evicted set of profiles sharing one embedding model.
+    Args:
+        root (str): Directory containing one sub-directory per profile.
+        embedding_model: Embedding model shared by every profile.
+        memory_budget (int): Bytes of estimated index memory before evicting.
+        k (int): Resume chunks returned per query.
+    """
+
+    def __init__(self, root, embedding_model, memory_budget=256 * 1024 * 1024, k=5):
+        self.root = root
+        self.embedding_model = embedding_model
+        self.memory_budget = memory_budget
+        self.k = k
+        self._profiles = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self._load_ids = itertools.count(1)
+
+    def profile_ids(self):
+        """Ids of every profile available on disk."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if PROFILE_ID_PATTERN.match(name) and os.path.exists(os.path.join(self.root, name, "resume.txt"))
+        )
+
+    def loaded_ids(self):
+        with self._lock:
+            return list(self._profiles)
+
+    def memory_bytes(self):
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def get(self, profile_id):
+        """
+        Return a loaded profile, loading it on first use.
+        Raises:
+            ProfileNotFound: If no such profile exists on disk.
+        """
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+            if profile is not None:
+                self._profiles.move_to_end(profile_id)
+                metrics.incr("profile_cache_hits")
+                return profile
+        # Only ids that exist on disk get a load lock, so bad ids cannot grow _load_locks
+        directory = os.path.join(self.root, profile_id)
+        if not PROFILE_ID_PATTERN.match(profile_id) or not os.path.exists(os.path.join(directory, "resume.txt")):
+            raise ProfileNotFound(profile_id)
+        with self._lock:
+            load_lock = self._load_locks.setdefault(profile_id, threading.Lock())
+
+        # Load outside the registry lock so other profiles keep being served
+        evicted = []
+        with load_lock:
+            try:
+                with self._lock:
+                    profile = self._profiles.get(profile_id)
+                    if profile is not None:
+                        return profile
+
+                start = time.perf_counter()
+                profile = Profile(profile_id, directory, self.embedding_model, k=self.k, load_id=next(self._load_ids))
+                metrics.observe("profile_load_seconds", time.perf_counter() - start)
+                metrics.incr("profile_cache_misses")
+
+                with self._lock:
+                    self._profiles[profile_id] = profile
+                    self._sizes[profile_id] = profile.memory_bytes()
+                    evicted = self._evict()
+                    metrics.gauge("profiles_loaded", len(self._profiles))
+                    metrics.gauge("profiles_memory_bytes", sum(self._sizes.values()))
+            finally:
+                # Also on a failed load (e.g. resume.txt removed meanwhile), so the lock never lingers
+                with self._lock:
+                    self._load_locks.pop(profile_id, None)
+
+        # Requests may still hold an evicted profile's retriever; drop its collections a little later
+        for old in evicted:
+            timer = threading.Timer(EVICTION_GRACE_SECONDS, old.close)
+            timer.daemon = True
+            timer.start()
+        return profile
+
+    def close(self):
+        """Unload every profile and drop its collections."""
+        with self._lock:
+            profiles = list(self._profiles.values())
+            self._profiles.clear()
+            self._sizes.clear()
+        for profile in profiles:
+            profile.close()
+
+    def _evict(self):
+        """Pop least recently used profiles over the budget. Caller holds the lock."""
+        evicted = []
+        while len(self._profiles) > 1 and sum(self._sizes.values()) > self.memory_budget:
+            profile_id, profile = self._profiles.popitem(last=False)
+            del self._sizes[profile_id]
+            evicted.append(profile)
+            metrics.incr("profile_evictions")
+            logger.info("Evicted profile %s", profile_id)
+        return evicted
@@ -1,4 +1,10 @@
+import json
+import re
+
 from langchain.embeddings import HuggingFaceEmbeddings
+from langchain.vectorstores import Chroma
+
+from llm_cache import cache_key
 
 def setup_embedding_model(model_name: str):
     """
@@ -27,36 +33,209 @@ def load_text_data(file_path: str):
     except Exception as e:
         raise RuntimeError(f"An error occurred while reading the file: {e}")
 
-def semantic_search(prompt, retriever):
+def resume_sections(text: str):
+    """
+    Split resume text into its "---" separated sections.
+    Args:
+        text (str): Full resume text.
+    Returns:
+        sections (list): List of (title, body) tuples. The title is the section's
+            first line with decorations removed, or "SUMMARY" for the untitled intro.
+    """
+    sections = []
+    for chunk in text.split("---"):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        heading = chunk.splitlines()[0].strip().strip("=").strip()
+        title = heading if heading.isupper() else "SUMMARY"
+        sections.append((title, chunk))
+    return sections
+
+
+def build_retriever(embedding_model, texts, k=5, metadatas=None, collection_name="resume"):
+    """
+    Embed texts into an in-memory Chroma collection and wrap it as a retriever.
+    Args:
+        embedding_model: Embedding model used to embed the texts.
+        texts (list): Chunks to index.
+        k (int): Number of documents returned per query.
+        metadatas (list): Optional metadata dict per chunk.
+        collection_name (str): Chroma collection name; must be unique per live index.
+    Returns:
+        retriever: Similarity retriever over the collection.
+    """
+    db = Chroma.from_texts(texts, embedding_model, metadatas=metadatas, collection_name=collection_name)
+    return db.as_retriever(search_type="similarity", search_kwargs={"k": k})
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, tokenizer-free estimate of the LLM token count of a text.
+    Counts words and standalone punctuation, which tracks BPE token counts
+    closely enough for comparing prompt sizes.
+    """
+    return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+def semantic_search(prompt, retriever, sections=None):
     """
     Perform semantic search using the retriever.
     :param prompt: str, The user query or prompt.
     :param retriever: retriever object, Initialized retriever for the database.
+    :param sections: list of str, Optional resume section titles to restrict the search to.
     :return: List of relevant documents.
     """
-    # Query the retriever with the user prompt
-    results = retriever.get_relevant_documents(prompt)
+    if sections:
+        # Same k as the retriever, but only over chunks whose "section" metadata matches
+        results = retriever.vectorstore.similarity_search(
+            prompt, k=retriever.search_kwargs.get("k", 4), filter={"section": {"$in": list(sections)}}
+        )
+    else:
+        # Query the retriever with the user prompt
+        results = retriever.get_relevant_documents(prompt)
     final = ""
     # Display the results
     for idx, doc in enumerate(results, 1):
         final += doc.page_content + "\n\n"
     return final
-    
-# ✅ In utils.py
+
+
+def semantic_search_batch(prompts, retriever):
+    """
+    Perform semantic search for several prompts with a single embedding call.
+    :param prompts: list of str, The user queries.
+    :param retriever: retriever object over a vector store (see build_retriever).
+    :return: List of excerpt strings, one per prompt, as returned by semantic_search.
+    """
+    vectorstore = retriever.vectorstore
+    embeddings = vectorstore.embeddings
+    # Query embeddings must not land in a document-embedding cache
+    embed = getattr(embeddings, "embed_queries", embeddings.embed_documents)
+    vectors = embed(list(prompts))
+    k = retriever.search_kwargs.get("k", 4)
+    return [
+        "".join(doc.page_content + "\n\n" for doc in vectorstore.similarity_search_by_vector(vector, k=k))
+        for vector in vectors
+    ]
+
+
+PUBLICATIONS_PATH = "data/publications.json"
+
+
+def load_publications(file_path: str = PUBLICATIONS_PATH):
+    """
+    Load publications, apps and projects from a JSON data file.
+    Args:
+        file_path (str): Path to a JSON list of objects with "title", "link",
+            and optional "type" and "summary" keys.
+    Returns:
+        publications (list): List of publication dicts.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The file at {file_path} was not found.")
+    except ValueError as e:
+        raise RuntimeError(f"Invalid publications file {file_path}: {e}")
+
+
 def get_publications():
+    return load_publications(PUBLICATIONS_PATH)
+
+
+def publication_document(publication):
+    """Text embedded for a publication: its title, type and summary."""
+    parts = [publication["title"]]
+    if publication.get("type"):
+        parts.append(f"({publication['type']})")
+    if publication.get("summary"):
+        parts.append(publication["summary"])
+    return " ".join(parts)
+
+
+# "all"/"every" only counts when it quantifies the entries themselves, e.g. "list all of Akshay's publications"
+LIST_ALL_PATTERN = re.compile(
+    r"\b(all|every|full list|complete list)\b[\w\s']{0,25}?\b(publications?|papers?|articles?|apps?|projects?)\b",
+    re.IGNORECASE,
+)
+LIST_ALL_LIMIT = 10
+
+
+def search_publications(prompt, retriever, list_all_limit=LIST_ALL_LIMIT):
+    """
+    Retrieve only the publications relevant to the prompt. When the prompt
+    asks for all of them, list the first entries in file order instead, with
+    a count of the rest, so the block stays bounded however long the list is.
+    :param prompt: str, The user query or prompt.
+    :param retriever: retriever object over publication documents (see publication_document).
+    :param list_all_limit: int, Entries listed for "list all" questions.
+    :return: Bullet list of "title (link)" lines: at most the retriever's k, or list_all_limit plus a count line.
+    """
+    remaining = 0
+    if LIST_ALL_PATTERN.search(prompt):
+        # Metadata only, no vectors; a few hundred small dicts
+        metadatas = retriever.vectorstore.get(include=["metadatas"])["metadatas"]
+        metadatas = sorted(metadatas, key=lambda metadata: metadata.get("position", 0))
+        metadatas, remaining = metadatas[:list_all_limit], max(0, len(metadatas) - list_all_limit)
+    else:
+        metadatas = [doc.metadata for doc in retriever.get_relevant_documents(prompt)]
+    lines = []
+    for metadata in metadatas:
+        link = metadata.get("link")
+        title = metadata["title"]
+        lines.append(f"- {title} ({link})" if link else f"- {title}")
+    if remaining:
+        lines.append(f"- ...and {remaining} more entries not listed here")
+    return "\n".join(lines)
+
+
+JD_MATCH_PREFIX = "How well does Akshay's background match this job description?\n\n"
+
+SYSTEM_PROMPT_TEMPLATE = """
+    You are an intelligent assistant named Ressy designed to answer queries about {name}'s professional background and experiences based on their resume.
+    Guidelines for generating responses:
+    - Only use information directly found in the provided resume excerpts.
+    - If the information is incomplete or ambiguous in the excerpts, inform the user that you lack sufficient data to answer.
+    - If a user asks a general or unrelated question (e.g., about something that isn't part of the resume), you should politely indicate that you can only respond related to {first_name}'s resume.
+    - Crucially, when asked about publications or research, clearly list any published papers or apps mentioned in the provided text. Include their full titles and associated links (like DOI or Amazon store URL) if they are present in the excerpts.
+    Please ensure that your answers are factual and reflect only the information available in the resume. Do not provide opinions or speculate beyond what is provided in the document.
+    """
+
+SYSTEM_PROMPT = """
+    You are an intelligent assistant named Ressy designed to answer queries about Akshay Abraham's professional background and experiences based on his resume.
+    Guidelines for generating responses:
+    - Only use information directly found in the provided resume excerpts.
+    - If the information is incomplete or ambiguous in the excerpts, inform the user that you lack sufficient data to answer.
+    - If a user asks a general or unrelated question (e.g., about something that isn't part of the resume), you should politely indicate that you can only respond related to Akshay's resume.
+    - Crucially, when asked about publications or research, clearly list any published papers or apps mentioned in the provided text. Include their full titles and associated links (like DOI or Amazon store URL) if they are present in the excerpts.
+    Please ensure that your answers are factual and reflect only the information available in the resume. Do not provide opinions or speculate beyond what is provided in the document.
+    """
+
+
+def build_chat_messages(user_question, relevant_excerpts, system_prompt=SYSTEM_PROMPT, first_name="Akshay"):
+    """
+    Build the chat messages sent to the LLM for a question and its excerpts.
+    Args:
+        system_prompt (str): System prompt naming the profile's owner.
+        first_name (str): Owner's first name, used to label the excerpts.
+    Returns:
+        messages (list): System and user messages.
+    """
     return [
+        {"role": "system", "content": system_prompt},
         {
-            "title": "Design and validation of novel SARS-CoV-2 inhibitors using artificial intelligence and bioinformatics methods",
-            "link": "https://doi.org/10.1039/D4ME00062E"
+            "role": "user",
+            "content": "User Question: "
+            + user_question
+            + f"\n Relevant {first_name}'s Resume/CV Exerpt(s): \n"
+            + relevant_excerpts,
         },
-        {
-            "title": "Periodic Table Mobile App (Amazon App Store)",
-            "link": "https://www.amazon.com/dp/B08BYHLBX8"
-        }
     ]
 
 
-def resume_chat_completion(client, model, user_question, relevant_excerpts):
+def resume_chat_completion(client, model, user_question, relevant_excerpts, system_prompt=SYSTEM_PROMPT, first_name="Akshay", cache=None):
     """
     Generate a response to the user's question using the pre-trained model.
     Args:
@@ -64,34 +243,63 @@ def resume_chat_completion(client, model, user_question, relevant_excerpts):
         model (str): The model to use for the chat completion.
         user_question (str): The user's question.
         relevant_excerpts (str): The relevant excerpts from the resume.
+        system_prompt (str): System prompt; defaults to Akshay's.
+        first_name (str): Profile owner's first name.
+        cache (ResponseCache): Optional persistent answer cache (see llm_cache.py).
     Returns:
         response (str): The generated response to the user's question.
     """
-    # Define the system prompt
-    system_prompt = """
-    You are an intelligent assistant named Ressy designed to answer queries about Akshay Abraham's professional background and experiences based on his resume.
-    Guidelines for generating responses:
-    - Only use information directly found in the provided resume excerpts.
-    - If the information is incomplete or ambiguous in the excerpts, inform the user that you lack sufficient data to answer.
-    - If a user asks a general or unrelated question (e.g., about something that isn't part of the resume), you should politely indicate that you can only respond related to Akshay's resume.
-    - Crucially, when asked about publications or research, clearly list any published papers or apps mentioned in the provided text. Include their full titles and associated links (like DOI or Amazon store URL) if they are present in the excerpts.
-    Please ensure that your answers are factual and reflect only the information available in the resume. Do not provide opinions or speculate beyond what is provided in the document.
-    """
+    key = None
+    if cache is not None:
+        key = cache_key(model, system_prompt, user_question, relevant_excerpts, first_name)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
     # Generate a response to the user's question using the pre-trained model
     chat_completion = client.chat.completions.create(
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {
-                "role": "user",
-                "content": "User Question: "
-                + user_question
-                + "\n Relevant Akshay's Resume/CV Exerpt(s): \n"
-                + relevant_excerpts,
-            },
-        ],
+        messages=build_chat_messages(user_question, relevant_excerpts, system_prompt, first_name),
         model=model,
     )
     
     # Extract the response from the chat completion
     response = chat_completion.choices[0].message.content
-    return response
\ No newline at end of file
+    if cache is not None and response:
+        cache.put(key, response)
+    return response
+
+
+def resume_chat_completion_stream(client, model, user_question, relevant_excerpts, system_prompt=SYSTEM_PROMPT, first_name="Akshay", cache=None):
+    """
+    Streaming variant of resume_chat_completion.
+    Args:
+        client (Groq): Initialized Groq client.
+        model (str): The model to use for the chat completion.
+        user_question (str): The user's question.
+        relevant_excerpts (str): The relevant excerpts from the resume.
+        system_prompt (str): System prompt; defaults to Akshay's.
+        first_name (str): Profile owner's first name.
+        cache (ResponseCache): Optional persistent answer cache; a hit is yielded in one piece.
+    Yields:
+        delta (str): Successive pieces of the generated response.
+    """
+    key = None
+    if cache is not None:
+        key = cache_key(model, system_prompt, user_question, relevant_excerpts, first_name)
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    stream = client.chat.completions.create(
+        messages=build_chat_messages(user_question, relevant_excerpts, system_prompt, first_name),
+        model=model,
+        stream=True,
+    )
+    pieces = []
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            pieces.append(chunk.choices[0].delta.content)
+            yield chunk.choices[0].delta.content
+    if cache is not None and pieces:
+        cache.put(key, "".join(pieces))